@@ -2,17 +2,24 @@
 import argparse
 import sys
 import tempfile
-import shutil
 from pathlib import Path
 from typing import Dict, List
 
 from asl_tts_lib.config import Config, DEFAULT_CONFIG_PATH
 from asl_tts_lib.tokenizer import tokenize_text
-from asl_tts_lib.matcher import find_sound_matches
+from asl_tts_lib.matcher import find_sound_matches, get_sound_index
 from asl_tts_lib.audio import concat_audio
 from asl_tts_lib.sounds import load_sound_files
+from asl_tts_lib.tts import forget_phrase_file
 from asl_tts_lib.asl import play_via_asterisk
-from asl_tts_lib.utils import cache_cleanup, sanitize_filename_with_hash
+from asl_tts_lib.utils import (
+    cache_cleanup,
+    fast_materialize,
+    files_cache_key,
+    link_cache_alias,
+    sanitize_filename_with_hash,
+    touch_cache_file,
+)
 
 
 def main():
@@ -48,6 +55,7 @@ def main():
 
     # Load config
     config = Config.from_file(args.config)
+    config.ensure_dirs()
 
     # Check critical directories exist
     if not config.sounds_directory.exists():
@@ -55,13 +63,7 @@ def main():
 
     # Check TTS binary exists if auto-generation enabled
     if config.auto_generate_words or args.generate_tts:
-        tts_bin = Path(config.asl_tts_bin)
-        if not tts_bin.is_absolute():
-            # Try to find it in PATH
-            tts_path = shutil.which(config.asl_tts_bin)
-            if not tts_path:
-                sys.exit(f"Error: TTS binary not found in PATH: {config.asl_tts_bin}")
-        elif not tts_bin.exists():
+        if not config.asl_tts_bin_resolved:
             sys.exit(f"Error: TTS binary not found: {config.asl_tts_bin}")
 
     if args.verbose >= 1:
@@ -73,9 +75,6 @@ def main():
     if args.generate_tts:
         config.auto_generate_words = True
 
-    # Load available sound files
-    sounds = load_sound_files(config, args.verbose)
-
     # Get text from stdin if not provided as argument
     text = args.text
     if not text:
@@ -87,24 +86,57 @@ def main():
     if args.verbose >= 1:
         print(f"Text: {text}")
 
+    # Load available sound files
+    sounds = load_sound_files(config, args.verbose)
+
     # Tokenize text
     tokens = tokenize_text(text)
     if args.verbose >= 1:
         print(f"Initial tokens: {tokens}")
 
     # Find matching sound files
-    matches = find_sound_matches(tokens, sounds, config, args.verbose)
+    sound_index = get_sound_index(sounds, config.auto_phrase_matching)
+    matches = find_sound_matches(
+        tokens, sounds, config, args.verbose, sound_index=sound_index
+    )
 
-    # Create cache file for concatenated audio
-    filename = sanitize_filename_with_hash(text, config.max_phrase_words_for_filenames)
-    cache_file = Path(config.cache_directory) / f"{filename}.ul"
+    # Cache concatenated audio by its input files so that equivalent phrases
+    # ("hello world", "Hello  world!") share a single cache file. Texts are
+    # always matched first, since texts that look alike ("ABC", "abc") can
+    # match different sounds.
+    cache_file = config.cache_directory / f"{files_cache_key(matches)}.ul"
 
     # Concatenate audio files
-    concat_audio(matches, str(cache_file))
+    if touch_cache_file(cache_file):
+        if args.verbose >= 2:
+            print(f"Using cached file: {cache_file}")
+    else:
+        try:
+            concat_audio(matches, str(cache_file))
+        except OSError as e:
+            if e.filename not in matches:
+                raise
+            # Generated phrase files are assumed to still exist, so one that
+            # has gone since is forgotten and matching runs again to
+            # regenerate it
+            if args.verbose >= 1:
+                print(f"Could not read {e.filename}, matching again")
+            forget_phrase_file(e.filename)
+            matches = find_sound_matches(
+                tokens, sounds, config, args.verbose, sound_index=sound_index
+            )
+            cache_file = config.cache_directory / f"{files_cache_key(matches)}.ul"
+            concat_audio(matches, str(cache_file))
+
+    # Keep a readable name for the phrase pointing at the cached audio
+    filename = sanitize_filename_with_hash(text, config.max_phrase_words_for_filenames)
+    link_cache_alias(
+        cache_file, config.cache_directory / f"concat-{filename}.ul", args.verbose
+    )
 
     # Save output file if requested
     if args.file:
-        shutil.copy2(cache_file, args.file)
+        fast_materialize(cache_file, args.file)
         if args.verbose >= 1:
             print(f"Wrote output to {args.file}")
 
@@ -2,14 +2,15 @@
 """Generate common sound chunks for ASL TTS tools."""
 
 import argparse
+import asyncio
 import string
 import sys
 import time
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import subprocess
-from typing import Iterator, List, Tuple, Dict
+import tempfile
+from typing import Iterator, List, Optional, Tuple, Dict
 from asl_tts_lib.config import Config, DEFAULT_CONFIG_PATH
 from asl_tts_lib.utils import sanitize_filename_with_hash
 
@@ -17,6 +18,11 @@ from asl_tts_lib.utils import sanitize_filename_with_hash
 # Type for text-to-filename mappings
 TextMapping = Tuple[str, str]  # (filename, text)
 
+# generate_tts results
+TTS_DONE = "Done"
+TTS_SKIPPED = "Skipped"
+TTS_FAILED = "Failed"
+
 
 # Sound chunk generators
 def generate_letters() -> Iterator[TextMapping]:
@@ -281,14 +287,14 @@ def generate_custom_phrases(phrases_file: Path) -> Iterator[TextMapping]:
                     yield line, line
 
 
-def generate_tts(
+async def generate_tts(
     filename: str,
     text: str,
     output_file: Path,
     config: Config,
     verbose: int = 0,
     force: bool = False,
-) -> Tuple[str, float, bool]:
+) -> Tuple[float, str]:
     """Generate TTS for a single phrase.
 
     Args:
@@ -300,31 +306,132 @@ def generate_tts(
         force: Whether to force regeneration
 
     Returns:
-        Tuple of (text, time taken, success)
+        Tuple of (time taken, TTS_DONE, TTS_SKIPPED if the file already
+        exists, or TTS_FAILED)
     """
     start_time = time.time()
 
     # Skip if file exists and not forcing
     if output_file.exists() and not force:
-        return text, 0.0, False
+        return 0.0, TTS_SKIPPED
 
+    cmd = [
+        config.asl_tts_bin,
+        "-n",
+        "1",
+        "-t",
+        text,
+        "-f",
+        str(output_file.with_suffix("")),
+    ]
     try:
-        cmd = [
-            config.asl_tts_bin,
-            "-n",
-            "1",
-            "-t",
-            text,
-            "-f",
-            str(output_file.with_suffix("")),
-        ]
-        subprocess.run(cmd, check=True, capture_output=True)
-        return text, time.time() - start_time, True
-    except subprocess.CalledProcessError as e:
+        # Output is only used for error reporting, so don't buffer it otherwise
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE if verbose else subprocess.DEVNULL,
+        )
+        _, stderr = await proc.communicate()
+    except OSError as e:
         print(f"Error generating TTS for {text}: {e}", file=sys.stderr)
-        if e.stderr:
-            print(f"stderr: {e.stderr.decode()}", file=sys.stderr)
-        return text, time.time() - start_time, False
+        return time.time() - start_time, TTS_FAILED
+
+    if proc.returncode != 0:
+        e = subprocess.CalledProcessError(proc.returncode, cmd)
+        print(f"Error generating TTS for {text}: {e}", file=sys.stderr)
+        if stderr:
+            print(f"stderr: {stderr.decode()}", file=sys.stderr)
+        return time.time() - start_time, TTS_FAILED
+
+    return time.time() - start_time, TTS_DONE
+
+
+def _filter_existing(
+    work_items: List[Tuple[str, str, Path]], force: bool = False
+) -> List[Tuple[str, str, Path]]:
+    """Drop work items whose output file already exists, unless forcing.
+
+    Args:
+        work_items: List of (filename, text, output file) tuples
+        force: Whether to force regeneration
+
+    Returns:
+        The work items that still need to be generated
+    """
+    if force:
+        return list(work_items)
+
+    pending = []
+    for filename, text, output_file in work_items:
+        if output_file.exists():
+            print(f"Generating '{text}' -> '{filename}': Skipping, file already exists")
+            continue
+        pending.append((filename, text, output_file))
+    return pending
+
+
+def generate_tts_batch(
+    work_items: List[Tuple[str, str, Path]],
+    config: Config,
+    verbose: int = 0,
+    force: bool = False,
+) -> None:
+    """Generate TTS for all phrases with a single asl-tts invocation.
+
+    Args:
+        work_items: List of (filename, text, output file) tuples
+        config: Configuration object
+        verbose: Verbosity level
+        force: Whether to force regeneration
+    """
+    pending = _filter_existing(work_items, force)
+    if not pending:
+        return
+
+    start_time = time.time()
+
+    # With force, existing files count as generated only if they were rewritten
+    previous_mtimes = {
+        output_file: _mtime_ns(output_file) for _, _, output_file in pending
+    }
+
+    # Manifest is one "text<TAB>output path without suffix" line per phrase
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".tsv", prefix="asl-tts-seed-", delete=False
+    ) as manifest:
+        for _, text, output_file in pending:
+            text = " ".join(text.split())
+            manifest.write(f"{text}\t{output_file.with_suffix('')}\n")
+
+    # Report per phrase even if the run fails, since it may have got partway
+    try:
+        cmd = [config.asl_tts_bin, "--batch", manifest.name]
+        if verbose >= 2:
+            print(f"Running TTS command: {' '.join(cmd)}")
+        subprocess.run(cmd, check=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Error generating batch TTS: {e}", file=sys.stderr)
+    finally:
+        os.unlink(manifest.name)
+
+    duration = time.time() - start_time
+    generated = 0
+    for filename, text, output_file in pending:
+        mtime = _mtime_ns(output_file)
+        if mtime is not None and mtime != previous_mtimes[output_file]:
+            generated += 1
+            print(f"Generating '{text}' -> '{filename}': Done")
+        else:
+            print(f"Generating '{text}' -> '{filename}': Failed")
+    print(f"Generated {generated} of {len(pending)} phrases in {duration:.1f}s")
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Get the modification time of a file, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
 def generate_chunks(
@@ -340,7 +447,7 @@ def generate_chunks(
         config: Configuration object
         verbose: Verbosity level
         force: Whether to force regeneration
-        threads: Number of threads to use
+        threads: Maximum number of TTS processes to run at once
         phrases_file: Optional path to file with custom phrases
     """
     # Map of category to generator function
@@ -375,23 +482,48 @@ def generate_chunks(
             output_file = category_dir / f"{filename}.ul"
             work_items.append((filename, text, output_file))
 
-    # Process work items
-    with ThreadPoolExecutor(max_workers=threads) as executor:
-        futures = [
-            executor.submit(
-                generate_tts, filename, text, output_file, config, verbose, force
+    # A single batch run amortizes the TTS engine's startup across all phrases
+    if config.asl_tts_supports_batch:
+        generate_tts_batch(work_items, config, verbose, force)
+        return
+
+    # Only schedule phrases that actually need generating
+    work_items = _filter_existing(work_items, force)
+    if not work_items:
+        return
+
+    asyncio.run(_generate_all(work_items, config, verbose, force, threads))
+
+
+async def _generate_all(
+    work_items: List[Tuple[str, str, Path]],
+    config: Config,
+    verbose: int = 0,
+    force: bool = False,
+    threads: int = None,
+) -> None:
+    """Run TTS for all work items on one event loop, bounded by threads.
+
+    Args:
+        work_items: List of (filename, text, output file) tuples
+        config: Configuration object
+        verbose: Verbosity level
+        force: Whether to force regeneration
+        threads: Maximum number of TTS processes to run at once
+    """
+    semaphore = asyncio.Semaphore(threads or os.cpu_count() or 1)
+
+    async def run_one(filename: str, text: str, output_file: Path) -> None:
+        async with semaphore:
+            duration, status = await generate_tts(
+                filename, text, output_file, config, verbose, force
             )
-            for filename, text, output_file in work_items
-        ]
-
-        for future, (filename, text, _) in zip(as_completed(futures), work_items):
-            text, duration, generated = future.result()
-            if generated:
-                print(f"Generating '{text}' -> '{filename}': Done ({duration:.1f}s)")
-            else:
-                print(
-                    f"Generating '{text}' -> '{filename}': Skipping, file already exists"
-                )
+        if status == TTS_DONE:
+            print(f"Generating '{text}' -> '{filename}': Done ({duration:.1f}s)")
+        else:
+            print(f"Generating '{text}' -> '{filename}': {status}")
+
+    await asyncio.gather(*(run_one(*item) for item in work_items))
 
 
 def main():
@@ -418,7 +550,7 @@ def main():
         "--threads",
         type=int,
         default=os.cpu_count(),
-        help="Number of threads to use (default: number of CPUs, 1 to disable threading)",
+        help="Number of TTS processes to run at once (default: number of CPUs, 1 to run them one at a time)",
     )
     parser.add_argument(
         "-p",
@@ -434,14 +566,10 @@ def main():
 
     # Load config
     config = Config.from_file(args.config)
+    config.ensure_dirs()
 
     # Check TTS binary exists and is executable
-    tts_bin = Path(config.asl_tts_bin)
-    if not tts_bin.is_absolute():
-        tts_path = subprocess.which(config.asl_tts_bin)
-        if not tts_path:
-            sys.exit(f"Error: TTS binary not found in PATH: {config.asl_tts_bin}")
-    elif not tts_bin.exists():
+    if not config.asl_tts_bin_resolved:
         sys.exit(f"Error: TTS binary not found: {config.asl_tts_bin}")
 
     # Generate chunks
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 
+import os
 import sys
 import subprocess
 import argparse
 from pathlib import Path
-import shutil
 
 from asl_tts_lib.asl import play_via_asterisk
 from asl_tts_lib.config import Config, DEFAULT_CONFIG_PATH
-from asl_tts_lib.utils import cache_cleanup, sanitize_filename_with_hash
+from asl_tts_lib.utils import (
+    cache_cleanup,
+    content_cache_key,
+    fast_materialize,
+    link_cache_alias,
+    sanitize_filename_with_hash,
+    touch_cache_file,
+)
 
 
 def main():
@@ -43,6 +50,7 @@ def main():
         parser.error("Either -n/--node or -f/--file (or both) must be specified")
 
     config = Config.from_file(args.config)
+    config.ensure_dirs()
     verbose = args.verbose
 
     if verbose >= 1:
@@ -50,20 +58,25 @@ def main():
         for key, value in config.to_dict().items():
             print(f"  {key}: {value}")
 
-    filename = sanitize_filename_with_hash(
-        args.text, config.max_phrase_words_for_filenames
-    )
-    cache_file = config.cache_directory / f"{filename}.ul"
+    # Cache by what asl-tts is actually asked to speak so that whitespace
+    # differences in the input share a single cache file
+    tts_text = " ".join(args.text.split())
+    key = content_cache_key([config.asl_tts_bin, tts_text])
+    cache_file = config.cache_directory / f"{key}.ul"
 
-    if not cache_file.exists():
+    if not touch_cache_file(cache_file):
+        # asl-tts writes to a temporary file that is renamed into place, so
+        # the cache never holds partial audio
+        temp_base = config.cache_directory / f".{key}.{os.getpid()}.tmp"
+        temp_file = temp_base.with_name(temp_base.name + ".ul")
         cmd = [
             config.asl_tts_bin,
             "-n",
             args.node if args.node else "0",
             "-t",
-            args.text,
+            tts_text,
             "-f",
-            str(config.cache_directory / filename),
+            str(temp_base),
         ]
         if verbose >= 2:
             print(
@@ -72,20 +85,31 @@ def main():
             )
         try:
             subprocess.run(cmd, check=True)
+            os.replace(temp_file, cache_file)
         except subprocess.CalledProcessError as e:
             print(f"Error generating TTS: {e}", file=sys.stderr)
-            if cache_file.exists():
-                cache_file.unlink()
+            temp_file.unlink(missing_ok=True)
             sys.exit(2)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
     else:
         if verbose >= 2:
             print(f"Using cached file: {cache_file}")
 
+    # Keep a readable name for the phrase pointing at the cached audio
+    filename = sanitize_filename_with_hash(
+        args.text, config.max_phrase_words_for_filenames
+    )
+    link_cache_alias(
+        cache_file, config.cache_directory / f"wrapper-{filename}.ul", verbose
+    )
+
     if args.file:
         try:
             output_path = Path(args.file + ".ul")
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(cache_file, output_path)
+            fast_materialize(cache_file, output_path)
             if verbose >= 2:
                 print(f"Saved audio to: {output_path}")
         except Exception as e:
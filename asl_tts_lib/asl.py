@@ -1,8 +1,10 @@
 """Asterisk integration utilities."""
 
+import os
+import re
+import shlex
 import sys
 import subprocess
-from pathlib import Path
 from .constants import EXIT_CODES
 from typing import Dict
 
@@ -18,12 +20,17 @@ def play_via_asterisk(file_path: str, node_number: str, verbose: int = 0) -> Non
     if not file_path:
         return
 
+    if not re.fullmatch(r"\d+", str(node_number)):
+        print(f"Error: Invalid node number: {node_number}", file=sys.stderr)
+        sys.exit(EXIT_CODES["INVALID_ARGS"])
+
     try:
-        bare_sound_path = str(Path(file_path).with_suffix("").resolve())
-        command = f'asterisk -rx "rpt localplay {node_number} {bare_sound_path}"'
+        # Cache paths are already absolute, see Config.cache_directory
+        bare_sound_path = os.path.splitext(file_path)[0]
+        cmd = ["asterisk", "-rx", f"rpt localplay {node_number} {bare_sound_path}"]
         if verbose:
-            print(f"Executing: {command}")
-        subprocess.run(command, shell=True, check=True)
-    except subprocess.CalledProcessError as e:
+            print(f"Executing: {' '.join(shlex.quote(arg) for arg in cmd)}")
+        subprocess.run(cmd, check=True)
+    except (subprocess.CalledProcessError, OSError) as e:
         print(f"Error playing audio via Asterisk: {e}", file=sys.stderr)
         sys.exit(EXIT_CODES["PLAYBACK_ERROR"])
@@ -1,9 +1,13 @@
 """Audio file handling utilities."""
 
+import os
+import shutil
 import subprocess
 from pathlib import Path
 from typing import List
 
+COPY_BUFFER_SIZE = 64 * 1024
+
 
 def _get_format(file_path: str) -> str:
     """Get the format for a sound file based on extension.
@@ -29,6 +33,10 @@ def _get_format(file_path: str) -> str:
 def concat_audio(files: List[str], output_path: str) -> None:
     """Concatenate audio files.
 
+    The audio is written to a temporary file next to output_path and renamed
+    into place, so output_path never holds partial audio, even if the
+    process is interrupted or another process is reading it.
+
     Args:
         files: List of paths to audio files
         output_path: Path to write concatenated audio
@@ -37,7 +45,35 @@ def concat_audio(files: List[str], output_path: str) -> None:
         return
 
     # Ensure output directory exists
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    output = Path(output_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = output.with_name(f".{output.name}.{os.getpid()}.tmp")
+
+    try:
+        _concat_audio(files, str(temp_path), _get_format(output_path))
+        os.replace(temp_path, output)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _concat_audio(files: List[str], output_path: str, out_fmt: str) -> None:
+    """Concatenate audio files, see concat_audio.
+
+    Args:
+        files: List of paths to audio files
+        output_path: Path to write concatenated audio
+        out_fmt: Format string for sox for the output
+    """
+    # u-law is headerless 8 kHz mono, so if everything is already u-law the
+    # concatenation is a plain byte append and sox isn't needed at all
+    formats = {_get_format(f) for f in files} | {out_fmt}
+    if formats == {"ul"}:
+        with open(output_path, "wb") as out:
+            for f in files:
+                with open(f, "rb") as src:
+                    shutil.copyfileobj(src, out, COPY_BUFFER_SIZE)
+        return
 
     # Build sox command with format for each file, silence warnings with -V0
     cmd = ["sox", "-V0"]
@@ -46,7 +82,6 @@ def concat_audio(files: List[str], output_path: str) -> None:
         cmd.extend(["-t", fmt, f])
 
     # Add output format
-    out_fmt = _get_format(output_path)
     cmd.extend(["-t", out_fmt, output_path])
 
     subprocess.run(cmd, check=True)
@@ -1,6 +1,9 @@
 """Configuration handling for ASL TTS tools."""
 
-from dataclasses import dataclass, asdict
+import os
+import shutil
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, Optional
 import yaml
@@ -8,6 +11,18 @@ import yaml
 DEFAULT_CONFIG_PATH = "/etc/asl-tts-tools/config.yaml"
 
 
+def _yaml_loader():
+    """Get the libyaml-backed safe loader if available, else the pure-Python one."""
+    return getattr(yaml, "CSafeLoader", None) or yaml.SafeLoader
+
+
+@lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML config file, memoized on its path and modification time."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_yaml_loader()) or {}
+
+
 @dataclass
 class Config:
     # Directory paths with defaults
@@ -25,17 +40,23 @@ class Config:
     # TTS settings
     auto_generate_words: bool = True
     asl_tts_bin: str = "asl-tts"
+    asl_tts_supports_batch: bool = False  # asl-tts accepts --batch manifest.tsv
+    tts_parallel: bool = True  # run several asl-tts processes at once
 
     # Cache settings
     max_cache_files: int = 100  # -1 means no limit
     max_cache_age_days: int = -1  # -1 means no limit
 
+    # Resolved from asl_tts_bin, None if the binary can't be found
+    asl_tts_bin_resolved: Optional[str] = field(default=None, init=False)
+
     def __post_init__(self):
         """Validate and process config after initialization."""
         # Convert string paths to Path objects
         self.sounds_directory = Path(self.sounds_directory)
         self.custom_sounds_directory = Path(self.custom_sounds_directory)
-        self.cache_directory = Path(self.cache_directory)
+        # Resolved once here so playback can use cache paths as-is
+        self.cache_directory = Path(self.cache_directory).resolve()
 
         # Validate settings
         if self.max_cache_files != -1 and self.max_cache_files < 0:
@@ -56,9 +77,21 @@ class Config:
         if not self.silence_sound:
             raise ValueError("silence_sound cannot be empty")
 
-        # Create necessary directories
-        self.custom_sounds_directory.mkdir(parents=True, exist_ok=True)
-        self.cache_directory.mkdir(parents=True, exist_ok=True)
+        # Locate the TTS binary once rather than scanning PATH at each call site
+        if Path(self.asl_tts_bin).is_absolute():
+            if Path(self.asl_tts_bin).exists():
+                self.asl_tts_bin_resolved = self.asl_tts_bin
+        else:
+            self.asl_tts_bin_resolved = shutil.which(self.asl_tts_bin)
+
+    def ensure_dirs(self) -> None:
+        """Create the custom sounds and cache directories if they don't exist.
+
+        Only needed by tools that write sound or cache files.
+        """
+        for directory in (self.custom_sounds_directory, self.cache_directory):
+            if not directory.is_dir():
+                directory.mkdir(parents=True, exist_ok=True)
 
     @classmethod
     def from_file(cls, path: Optional[str] = None) -> "Config":
@@ -73,13 +106,12 @@ class Config:
         if not path:
             return cls()
 
-        with open(path) as f:
-            data = yaml.safe_load(f) or {}
+        data = _parse_config_file(str(path), os.stat(path).st_mtime_ns)
 
         return cls(**data)
 
     def to_dict(self):
         """Convert config to dictionary."""
-        return {
-            k: str(v) if isinstance(v, Path) else v for k, v in asdict(self).items()
-        }
+        # Fields are all scalars, so skip asdict()'s recursive deep copy
+        values = ((f.name, getattr(self, f.name)) for f in fields(self))
+        return {k: str(v) if isinstance(v, Path) else v for k, v in values}
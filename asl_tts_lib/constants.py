@@ -8,6 +8,7 @@ EXIT_CODES = {
     "AUDIO_PROCESSING_ERROR": 3,
     "CONFIG_ERROR": 4,
     "FILE_ERROR": 5,
+    "PLAYBACK_ERROR": 6,
 }
 
 # Maps special characters to letter sounds (letters/X.ulaw)
@@ -105,4 +106,4 @@ CHAR_TO_DIGIT_MAP = {
 }
 
 # Special characters that map to silence
-PAUSE_CHARS = {",", ".", ";", ":", "-"}
+PAUSE_CHARS = frozenset([",", ".", ";", ":", "-"])
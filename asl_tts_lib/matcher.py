@@ -1,15 +1,126 @@
 """Sound file matching utilities."""
 
-from typing import Dict, List, Optional, Tuple, Any
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Tuple, Any
+import string
 import sys
 from asl_tts_lib.config import Config
-from asl_tts_lib.sounds import normalize_phrase
+from asl_tts_lib.sounds import get_phrase_trie, normalize_phrase, sound_files_derived
 from asl_tts_lib.tokenizer import _is_word_token
-from asl_tts_lib.tts import should_generate_phrase, generate_missing_phrase
+from asl_tts_lib.tts import should_generate_phrase, generate_missing_phrases
 from asl_tts_lib.utils import sanitize_filename_with_hash
 from .constants import CHAR_TO_DIGIT_MAP, CHAR_TO_LETTER_MAP, PAUSE_CHARS
+from functools import lru_cache
 import os
 
+# Sound keys for ASCII digits and letters, built once at import. Letters map
+# to their candidate keys in lookup order, see _get_letter_key.
+_DIGIT_KEYS = {digit: sys.intern(f"digits/{digit}") for digit in string.digits}
+_LETTER_CANDIDATES = {
+    letter: (
+        sys.intern(f"letters/{letter}"),
+        sys.intern(letter),
+        sys.intern(f"alpha/{letter}"),
+        sys.intern(f"phonetic/{letter}_p"),
+    )
+    for letter in string.ascii_lowercase
+}
+
+# Directories _generate_tts has already created
+_MKDIR_CACHE = set()
+
+# Marks characters missing from a char_keys table
+_UNRESOLVED = object()
+
+# Token classification flags, see _classify_token
+_TOKEN_UPPER_ALPHA = 1
+_TOKEN_DIGITS = 2
+_TOKEN_HAS_ALNUM = 4
+_TOKEN_HAS_LOWER = 8
+
+
+@dataclass(frozen=True)
+class SoundIndex:
+    """Lookup tables derived from a sounds mapping.
+
+    Building these takes a pass over all sounds, so get_sound_index keeps
+    the index with mappings from load_sound_files, and callers matching many
+    texts can pass it to find_sound_matches.
+    """
+
+    # Sound key for every ASCII letter and digit, None if there is no sound
+    char_keys: Dict[str, Optional[str]]
+    # Special character map token -> (sound key, sound file path)
+    special_char_sounds: Dict[str, Tuple[str, str]]
+    # Trie from get_phrase_trie, None if built without one
+    phrase_trie: Optional[Dict] = None
+
+
+def get_sound_index(sounds: Mapping[str, str], phrase_trie: bool = True) -> SoundIndex:
+    """Get the sound index for a sounds mapping.
+
+    For a mapping from load_sound_files the index is built once and kept with
+    the mapping; otherwise it is built on every call.
+
+    Args:
+        sounds: Dictionary mapping normalized phrases to full file paths
+        phrase_trie: Whether to include the phrase trie (only needed for
+            auto_phrase_matching)
+
+    Returns:
+        The sound index
+    """
+    return sound_files_derived(
+        sounds,
+        "sound_index_with_trie" if phrase_trie else "sound_index",
+        lambda sounds: build_sound_index(sounds, phrase_trie),
+    )
+
+
+def build_sound_index(
+    sounds: Mapping[str, str], phrase_trie: bool = True
+) -> SoundIndex:
+    """Build the lookup tables find_sound_matches uses for a sounds mapping.
+
+    Args:
+        sounds: Dictionary mapping normalized phrases to full file paths
+        phrase_trie: Whether to build the phrase trie (only needed for
+            auto_phrase_matching)
+
+    Returns:
+        The sound index
+    """
+    return SoundIndex(
+        char_keys=_build_char_keys(sounds),
+        special_char_sounds=_build_special_char_sounds(sounds),
+        phrase_trie=get_phrase_trie(sounds) if phrase_trie else None,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _classify_token(token: str) -> int:
+    """Classify a token for find_sound_matches.
+
+    Tokens repeat a lot, so the character scans are done once per distinct
+    token and combined into flags.
+
+    Args:
+        token: Token to classify
+
+    Returns:
+        Bitwise OR of the _TOKEN_* flags that apply to the token
+    """
+    flags = 0
+    if token.isupper() and token.isalpha():
+        flags |= _TOKEN_UPPER_ALPHA
+    if token.isdigit():
+        flags |= _TOKEN_DIGITS
+    if any(c.isalnum() for c in token):
+        flags |= _TOKEN_HAS_ALNUM
+    if any(c.islower() for c in token):
+        flags |= _TOKEN_HAS_LOWER
+    return flags
+
 
 def _handle_missing_sound(
     token: str, config: Config, sounds: Dict[str, str], verbose: int = 0
@@ -34,10 +145,11 @@ def _handle_missing_sound(
     if config.on_missing == "error":
         raise ValueError(f"No match found for token: {token}")
     elif config.on_missing == "beep":
-        if config.beep_sound in sounds:
+        beep_path = sounds.get(config.beep_sound)
+        if beep_path is not None:
             if verbose >= 1:
                 print(f"Using beep sound for '{token}' -> {config.beep_sound}")
-            return sounds[config.beep_sound]
+            return beep_path
         else:
             print(
                 f"Warning: Beep sound not found: {config.beep_sound}", file=sys.stderr
@@ -50,7 +162,11 @@ def _handle_missing_sound(
 
 
 def find_sound_matches(
-    tokens: List[str], sounds: Dict[str, str], config: Config, verbose: int = 0
+    tokens: List[str],
+    sounds: Dict[str, str],
+    config: Config,
+    verbose: int = 0,
+    sound_index: Optional[SoundIndex] = None,
 ) -> List[str]:
     """Find matching sound files for tokens.
 
@@ -59,6 +175,7 @@ def find_sound_matches(
         sounds: Dictionary mapping normalized phrases to full file paths
         config: Configuration object
         verbose: Verbosity level (0=none, 1=basic, 2=detailed)
+        sound_index: Index from get_sound_index(sounds), looked up if not given
 
     Returns:
         List of paths to matching sound files
@@ -66,146 +183,254 @@ def find_sound_matches(
     matches = []
     i = 0
 
+    # Resolve letter, digit and special character sounds once instead of
+    # per token
+    if sound_index is None:
+        sound_index = get_sound_index(sounds, config.auto_phrase_matching)
+    char_keys = sound_index.char_keys
+    special_char_sounds = sound_index.special_char_sounds
+
+    phrase_trie = sound_index.phrase_trie
+    if config.auto_phrase_matching and phrase_trie is None:
+        phrase_trie = get_phrase_trie(sounds)
+
+    # Pauses depend on the configured silence sound
+    silence_path = sounds.get(config.silence_sound)
+
+    single_char_matches = _build_single_char_matches(
+        sounds, config, char_keys, special_char_sounds
+    )
+
+    # Phrases to generate with TTS once all tokens are matched, as (index of
+    # their place in matches, token, phrase, normalized phrase)
+    missing_phrases = []
+
     while i < len(tokens):
+        tok = tokens[i]
+
         if verbose >= 2:
-            print(f"\nTrying to match token: {tokens[i]}")
+            print(f"\nTrying to match token: {tok}")
+
+        # Most single characters always resolve to the same sound
+        if len(tok) == 1 and tok in single_char_matches:
+            path, message = single_char_matches[tok]
+            if verbose >= 1:
+                print(message)
+            matches.append(path)
+            i += 1
+            continue
+
+        flags = _classify_token(tok)
 
         # Try parenthesized phrase - strongest match
-        if tokens[i].startswith("(") and tokens[i].endswith(")"):
-            phrase = tokens[i][1:-1]  # Remove parentheses
+        if tok.startswith("(") and tok.endswith(")"):
+            phrase = tok[1:-1]  # Remove parentheses
             normalized_phrase = sanitize_filename_with_hash(
                 phrase, config.max_phrase_words_for_filenames
             )
             if normalized_phrase in sounds:
                 path = sounds[normalized_phrase]
                 if verbose >= 1:
-                    print(f"Found exact match for '{tokens[i]}' -> {normalized_phrase}")
+                    print(f"Found exact match for '{tok}' -> {normalized_phrase}")
                 matches.append(path)
                 i += 1
                 continue
             elif should_generate_phrase(phrase, verbose):
-                tts_match = generate_missing_phrase(
-                    phrase, normalized_phrase, config, verbose
-                )
-                if tts_match:
-                    matches.append(tts_match)
-                    i += 1
-                    continue
+                missing_phrases.append((len(matches), tok, phrase, normalized_phrase))
+                matches.append(None)
+                i += 1
+                continue
 
         # Try exact match (e.g. {rpt/connected-to})
-        if tokens[i].startswith("{") and tokens[i].endswith("}"):
-            path = normalize_phrase(tokens[i][1:-1])
+        if tok.startswith("{") and tok.endswith("}"):
+            path = normalize_phrase(tok[1:-1])
             if path in sounds:
                 if verbose >= 1:
-                    print(f"Found exact match for '{tokens[i]}' -> {path}")
+                    print(f"Found exact match for '{tok}' -> {path}")
                 matches.append(sounds[path])
                 i += 1
                 continue
             else:
                 if verbose >= 1:
-                    print(f"No match found for '{tokens[i]}' -> {path}")
-                missing_sound = _handle_missing_sound(
-                    tokens[i], config, sounds, verbose
-                )
+                    print(f"No match found for '{tok}' -> {path}")
+                missing_sound = _handle_missing_sound(tok, config, sounds, verbose)
                 if missing_sound:
                     matches.append(missing_sound)
                 i += 1
                 continue
 
         # Try uppercase word as individual letters first
-        if tokens[i].isupper() and tokens[i].isalpha():
-            letter_matches = _try_letter_match(tokens[i], sounds, verbose)
+        if flags & _TOKEN_UPPER_ALPHA:
+            letter_matches = _try_letter_match(tok, sounds, verbose, char_keys)
             if letter_matches:
                 matches.extend(letter_matches)
                 i += 1
                 continue
 
         # Try phonetic match (e.g. [ABC])
-        if tokens[i].startswith("[") and tokens[i].endswith("]"):
-            phonetic_matches = _try_phonetic_match(tokens[i], sounds, verbose)
+        if tok.startswith("[") and tok.endswith("]"):
+            phonetic_matches = _try_phonetic_match(tok, sounds, verbose, char_keys)
             if phonetic_matches:
                 matches.extend(phonetic_matches)
                 i += 1
                 continue
 
         # Try digit sequence
-        if tokens[i].isdigit():
-            digit_matches = _try_digit_match(tokens[i], sounds, verbose)
+        if flags & _TOKEN_DIGITS:
+            digit_matches = _try_digit_match(tok, sounds, verbose, char_keys)
             if digit_matches:
                 matches.extend(digit_matches)
                 i += 1
                 continue
 
         # Try mixed alphanumeric as individual chars (e.g. A1, 1B)
-        if any(c.isalnum() for c in tokens[i]) and not any(
-            c.islower() for c in tokens[i]
-        ):
-            mixed_matches = _try_mixed_match(tokens[i], sounds, verbose)
+        if flags & (_TOKEN_HAS_ALNUM | _TOKEN_HAS_LOWER) == _TOKEN_HAS_ALNUM:
+            mixed_matches = _try_mixed_match(tok, sounds, verbose, char_keys)
             if mixed_matches:
                 matches.extend(mixed_matches)
                 i += 1
                 continue
 
-        # Try phrase match if enabled
-        if config.auto_phrase_matching:
-            phrase_match, consumed = _try_phrase_match(tokens[i:], sounds, verbose)
+        # Try phrase match if enabled. Phrases are made of word tokens, so
+        # tokens without letters or digits (e.g. "#", "?!") can't start one.
+        if config.auto_phrase_matching and flags & _TOKEN_HAS_ALNUM:
+            phrase_match, consumed = _try_phrase_match(tokens, phrase_trie, verbose, i)
             if phrase_match:
                 matches.append(phrase_match)
                 i += consumed
                 continue
 
         # Try punctuation/special characters/manual matches
-        if tokens[i] in PAUSE_CHARS:
-            if config.silence_sound in sounds:
-                if verbose >= 1:
-                    print(
-                        f"Using silence sound for '{tokens[i]}' -> {config.silence_sound}"
-                    )
-                matches.append(sounds[config.silence_sound])
-                i += 1
-                continue
-
-        if tokens[i] in CHAR_TO_DIGIT_MAP:
-            key = f"{'digits/' + CHAR_TO_DIGIT_MAP[tokens[i]]}"
-            print(f"Found letter sound match for '{tokens[i]}' -> {key}")
-            matches.append(sounds[key])
+        if silence_path is not None and tok in PAUSE_CHARS:
+            if verbose >= 1:
+                print(f"Using silence sound for '{tok}' -> {config.silence_sound}")
+            matches.append(silence_path)
             i += 1
             continue
 
-        if tokens[i] in CHAR_TO_LETTER_MAP:
-            key = f"letters/{CHAR_TO_LETTER_MAP[tokens[i]]}"
-            if key in sounds:
-                if verbose >= 1:
-                    print(f"Found letter sound match for '{tokens[i]}' -> {key}")
-                matches.append(sounds[key])
-                i += 1
-                continue
+        special_char_sound = special_char_sounds.get(tok)
+        if special_char_sound is not None:
+            key, path = special_char_sound
+            if verbose >= 1:
+                print(f"Found letter sound match for '{tok}' -> {key}")
+            matches.append(path)
+            i += 1
+            continue
 
         # Try TTS generation for words with lowercase letters
-        if any(c.islower() for c in tokens[i]):
-            if should_generate_phrase(tokens[i], verbose):
+        if flags & _TOKEN_HAS_LOWER:
+            if should_generate_phrase(tok, verbose):
                 normalized_phrase = sanitize_filename_with_hash(
-                    tokens[i], config.max_phrase_words_for_filenames
-                )
-                tts_match = generate_missing_phrase(
-                    tokens[i], normalized_phrase, config, verbose
+                    tok, config.max_phrase_words_for_filenames
                 )
-                if tts_match:
-                    matches.append(tts_match)
-                    i += 1
-                    continue
+                missing_phrases.append((len(matches), tok, tok, normalized_phrase))
+                matches.append(None)
+                i += 1
+                continue
 
         # If no match found, handle based on config
-        missing_sound = _handle_missing_sound(tokens[i], config, sounds, verbose)
+        missing_sound = _handle_missing_sound(tok, config, sounds, verbose)
         if missing_sound:
             matches.append(missing_sound)
         i += 1
 
-    return matches
+    if not missing_phrases:
+        return matches
+
+    # Generate all the missing phrases together, then fill in their places.
+    # A phrase that can't be generated is handled like any missing sound.
+    generated = generate_missing_phrases(
+        [(phrase, normalized) for _, _, phrase, normalized in missing_phrases],
+        config,
+        verbose,
+    )
+    for (index, tok, _, _), path in zip(missing_phrases, generated):
+        if path is None:
+            path = _handle_missing_sound(tok, config, sounds, verbose)
+        matches[index] = path
+
+    return [path for path in matches if path is not None]
+
+
+def _build_special_char_sounds(sounds: Dict[str, str]) -> Dict[str, Tuple[str, str]]:
+    """Resolve the sounds for the special character maps.
+
+    Digit sounds take precedence over letter sounds, and entries without a
+    sound are left out.
+
+    Args:
+        sounds: Dictionary of available sound files
+
+    Returns:
+        Dictionary of token to (sound key, sound file path)
+    """
+    table = {}
+
+    # Added from lowest to highest precedence
+    special_keys = [
+        (char, f"letters/{name}") for char, name in CHAR_TO_LETTER_MAP.items()
+    ] + [(char, f"digits/{name}") for char, name in CHAR_TO_DIGIT_MAP.items()]
+    for char, key in special_keys:
+        path = sounds.get(key)
+        if path is not None:
+            table[char] = (key, path)
+
+    return table
+
+
+def _build_single_char_matches(
+    sounds: Dict[str, str],
+    config: Config,
+    char_keys: Dict[str, Optional[str]],
+    special_char_sounds: Dict[str, Tuple[str, str]],
+) -> Dict[str, Tuple[str, str]]:
+    """Resolve single-character tokens whose match doesn't depend on context.
+
+    Uppercase letters and digits are matched before phrases are tried, and
+    punctuation can never start a phrase, so all of these resolve to the
+    same sound wherever they appear. Characters without a sound are left out
+    and go through the normal matching (and missing sound handling).
+
+    Args:
+        sounds: Dictionary of available sound files
+        config: Configuration object
+        char_keys: Table from _build_char_keys
+        special_char_sounds: Table from _build_special_char_sounds
+
+    Returns:
+        Dictionary of character to (sound file path, verbose message)
+    """
+    table = {}
+
+    for char in string.ascii_uppercase:
+        key = char_keys[char]
+        if key is not None:
+            table[char] = (sounds[key], f"Found letter match: {char} -> {key}")
+
+    for char in string.digits:
+        key = char_keys[char]
+        if key is not None:
+            table[char] = (sounds[key], f"Found digit match: {char} -> {key}")
+
+    for char, (key, path) in special_char_sounds.items():
+        if len(char) == 1 and not char.isalnum():
+            message = f"Found letter sound match for '{char}' -> {key}"
+            table[char] = (path, message)
+
+    silence_path = sounds.get(config.silence_sound)
+    if silence_path is not None:
+        for char in PAUSE_CHARS:
+            message = f"Using silence sound for '{char}' -> {config.silence_sound}"
+            table[char] = (silence_path, message)
+
+    return table
 
 
 def _try_phonetic_match(
-    token: str, sounds: Dict[str, str], verbose: int = 0
+    token: str,
+    sounds: Dict[str, str],
+    verbose: int = 0,
+    char_keys: Optional[Dict[str, Optional[str]]] = None,
 ) -> Optional[List[str]]:
     """Try to find phonetic matches for a token.
 
@@ -213,6 +438,7 @@ def _try_phonetic_match(
         token: Token to match (e.g. [ABC])
         sounds: Dictionary of available sound files
         verbose: Verbosity level (0=none, 1=basic, 2=detailed)
+        char_keys: Optional table from _build_char_keys
 
     Returns:
         List of paths to matching sound files if found, None otherwise
@@ -229,9 +455,13 @@ def _try_phonetic_match(
             continue
 
         if char.isdigit():
-            key = f"digits/{char}"
+            key = _get_char_key(char, sounds, char_keys)
         else:
-            key = f"phonetic/{char.lower()}_p"
+            candidates = _LETTER_CANDIDATES.get(char.lower())
+            if candidates is not None:
+                key = candidates[3]
+            else:
+                key = f"phonetic/{char.lower()}_p"
 
         if key in sounds:
             if verbose >= 1:
@@ -246,7 +476,10 @@ def _try_phonetic_match(
 
 
 def _try_digit_match(
-    token: str, sounds: Dict[str, str], verbose: int = 0
+    token: str,
+    sounds: Dict[str, str],
+    verbose: int = 0,
+    char_keys: Optional[Dict[str, Optional[str]]] = None,
 ) -> Optional[List[str]]:
     """Try to find digit matches for a token.
 
@@ -254,6 +487,7 @@ def _try_digit_match(
         token: Token to match (e.g. "123")
         sounds: Dictionary of available sound files
         verbose: Verbosity level (0=none, 1=basic, 2=detailed)
+        char_keys: Optional table from _build_char_keys
 
     Returns:
         List of paths to matching sound files if found, None otherwise
@@ -261,10 +495,15 @@ def _try_digit_match(
     if not token.isdigit():
         return None
 
+    if char_keys is None:
+        char_keys = {}
+
     matches = []
     for digit in token:
-        key = f"digits/{digit}"
-        if key in sounds:
+        key = char_keys.get(digit, _UNRESOLVED)
+        if key is _UNRESOLVED:
+            key = _get_char_key(digit, sounds)
+        if key is not None:
             if verbose >= 1:
                 print(f"Found digit match: {digit} -> {key}")
             matches.append(sounds[key])
@@ -285,12 +524,16 @@ def _get_letter_key(char: str, sounds: Dict[str, str]) -> Optional[str]:
         Key if found, None otherwise
     """
     # Try all possible paths for the letter
-    possible_keys = [
-        f"letters/{char.lower()}",  # Try letters/ prefix first
-        char.lower(),  # Try just the letter
-        f"alpha/{char.lower()}",  # Try alpha/ prefix
-        f"phonetic/{char.lower()}_p",  # Try phonetic as last resort
-    ]
+    lower = char.lower()
+    if lower in _LETTER_CANDIDATES:
+        possible_keys = _LETTER_CANDIDATES[lower]
+    else:
+        possible_keys = [
+            f"letters/{lower}",  # Try letters/ prefix first
+            lower,  # Try just the letter
+            f"alpha/{lower}",  # Try alpha/ prefix
+            f"phonetic/{lower}_p",  # Try phonetic as last resort
+        ]
 
     for key in possible_keys:
         if key in sounds:
@@ -308,11 +551,57 @@ def _get_digit_key(char: str) -> str:
     Returns:
         Key for digit sound
     """
-    return f"digits/{char}"
+    key = _DIGIT_KEYS.get(char)
+    if key is None:
+        key = f"digits/{char}"
+    return key
+
+
+def _get_char_key(
+    char: str,
+    sounds: Dict[str, str],
+    char_keys: Optional[Dict[str, Optional[str]]] = None,
+) -> Optional[str]:
+    """Get the key for a letter or digit sound.
+
+    Args:
+        char: Letter or digit character to look up
+        sounds: Dictionary of available sound files
+        char_keys: Optional table from _build_char_keys to look the character up in
+
+    Returns:
+        Key if found, None otherwise
+    """
+    if char_keys is not None and char in char_keys:
+        return char_keys[char]
+
+    if char.isdigit():
+        key = _get_digit_key(char)
+        return key if key in sounds else None
+
+    return _get_letter_key(char, sounds)
+
+
+def _build_char_keys(sounds: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """Resolve the sound key for every ASCII letter and digit.
+
+    Args:
+        sounds: Dictionary of available sound files
+
+    Returns:
+        Dictionary of character to key, or None if there is no sound for it
+    """
+    return {
+        char: _get_char_key(char, sounds)
+        for char in string.digits + string.ascii_letters
+    }
 
 
 def _try_mixed_match(
-    token: str, sounds: Dict[str, str], verbose: int = 0
+    token: str,
+    sounds: Dict[str, str],
+    verbose: int = 0,
+    char_keys: Optional[Dict[str, Optional[str]]] = None,
 ) -> Optional[List[str]]:
     """Try to match mixed alphanumeric token.
 
@@ -320,25 +609,25 @@ def _try_mixed_match(
         token: Token to match (e.g. "A1B2")
         sounds: Dictionary of available sound files
         verbose: Verbosity level (0=none, 1=basic, 2=detailed)
+        char_keys: Optional table from _build_char_keys
 
     Returns:
         List of paths to matching sound files if found, None otherwise
     """
+    if char_keys is None:
+        char_keys = {}
+
     matches = []
     for char in token:
-        if char.isdigit():
-            key = _get_digit_key(char)
-        elif char.isalpha():
-            key = _get_letter_key(char, sounds)
-            if key is None:
-                if verbose >= 1:
-                    print(f"No match found for char: {char}")
-                return None
+        if char.isdigit() or char.isalpha():
+            key = char_keys.get(char, _UNRESOLVED)
+            if key is _UNRESOLVED:
+                key = _get_char_key(char, sounds)
         else:
             # Skip non-alphanumeric
             continue
 
-        if key in sounds:
+        if key is not None:
             if verbose >= 1:
                 print(f"Found char match: {char} -> {key}")
             matches.append(sounds[key])
@@ -351,7 +640,10 @@ def _try_mixed_match(
 
 
 def _try_letter_match(
-    token: str, sounds: Dict[str, str], verbose: int = 0
+    token: str,
+    sounds: Dict[str, str],
+    verbose: int = 0,
+    char_keys: Optional[Dict[str, Optional[str]]] = None,
 ) -> Optional[List[str]]:
     """Try to match individual letters in a token.
 
@@ -359,6 +651,7 @@ def _try_letter_match(
         token: Token to match (e.g. "ABC")
         sounds: Dictionary of available sound files
         verbose: Verbosity level (0=none, 1=basic, 2=detailed)
+        char_keys: Optional table from _build_char_keys
 
     Returns:
         List of paths to matching sound files if found, None otherwise
@@ -366,65 +659,91 @@ def _try_letter_match(
     if not token.isalpha():  # Allow both upper and lowercase
         return None
 
+    if char_keys is None:
+        char_keys = {}
+
     matches = []
 
     for letter in token:
-        key = _get_letter_key(letter, sounds)
+        key = char_keys.get(letter, _UNRESOLVED)
+        if key is _UNRESOLVED:
+            key = _get_char_key(letter, sounds)
         if key is None:
             if verbose >= 1:
                 print(f"No letter match found for: {letter}")
             # Don't break - keep trying other letters
             continue
 
-        if key in sounds:
-            if verbose >= 1:
-                print(f"Found letter match: {letter} -> {key}")
-            matches.append(sounds[key])
+        # Keys are only returned for sounds that exist
+        if verbose >= 1:
+            print(f"Found letter match: {letter} -> {key}")
+        matches.append(sounds[key])
 
     # Return whatever matches we found, even if not all letters matched
     return matches if matches else None
 
 
 def _try_phrase_match(
-    tokens: List[str], sounds: Dict[str, str], verbose: int = 0
+    tokens: List[str], phrase_trie: Dict, verbose: int = 0, start: int = 0
 ) -> Tuple[Optional[str], int]:
-    """Try to find a phrase match starting at the first token and working backwards to find the longest possible match.
+    """Try to find the longest phrase match starting at the given token.
+
+    Walks the phrase trie one token at a time, remembering the last complete
+    phrase seen, and stops as soon as no known phrase continues with the
+    next token. Walking stops there, so the remaining tokens are indexed in
+    place rather than copied for every attempt.
 
     Args:
         tokens: List of tokens to try matching
-        sounds: Dictionary of available sound files
+        phrase_trie: Trie from build_phrase_trie
         verbose: Verbosity level (0=none, 1=basic, 2=detailed)
+        start: Index of the token to start matching at
 
     Returns:
         Tuple of (matching file path or None, number of tokens consumed)
     """
-    if not tokens:
+    if start >= len(tokens):
         return None, 0
 
     if verbose >= 2:
-        print(f"Trying phrase match for tokens: {tokens}")
+        print(f"Trying phrase match for tokens: {tokens[start:]}")
 
-    max_length = len(tokens)
+    node = phrase_trie
+    normalized_tokens = []
+    match, match_length = None, 0
 
-    # Find the first non-word token, if any
-    for i, token in enumerate(tokens):
+    for index in range(start, len(tokens)):
+        token = tokens[index]
+        # Phrases can't span non-word tokens
         if not _is_word_token(token):
-            max_length = i
+            if verbose >= 2:
+                print(
+                    f"Limited tokens due to non-word token, remaining tokens: {tokens[start:index]}"
+                )
             break
 
-    if verbose >= 2 and max_length < len(tokens):
-        print(
-            f"Limited tokens due to non-word token, remaining tokens: {tokens[:max_length]}"
-        )
+        # A token can normalize to several words (e.g. "connected-to")
+        normalized_token = normalize_phrase(token.lower())
+        for word in normalized_token.split(" "):
+            node = node.get(word)
+            if node is None:
+                break
+        if node is None:
+            break
 
-    for length in range(max_length, 0, -1):
-        phrase = normalize_phrase(" ".join(tokens[:length]).lower())
+        normalized_tokens.append(normalized_token)
         if verbose >= 2:
-            print(f"Trying phrase: {phrase}")
-        if phrase in sounds:
-            if verbose >= 1:
-                print(f"Found phrase match: {' '.join(tokens[:length])} -> {phrase}")
-            return sounds[phrase], length
+            print(f"Trying phrase: {' '.join(normalized_tokens)}")
+        if None in node:
+            match, match_length = node[None], len(normalized_tokens)
+
+    if match is not None:
+        if verbose >= 1:
+            phrase = " ".join(normalized_tokens[:match_length])
+            print(
+                f"Found phrase match: {' '.join(tokens[start:start + match_length])} -> {phrase}"
+            )
+        return match, match_length
 
     if verbose >= 2:
         print("No phrase match found")
@@ -437,7 +756,10 @@ def _generate_tts(phrase: str, tts_path: str, tts_engine: Any, verbose: int = 0)
         print(f"Generating TTS for phrase: {phrase}")
 
     # Just generate the TTS - no need to check permissions multiple times
-    os.makedirs(os.path.dirname(tts_path), exist_ok=True)
+    tts_dir = os.path.dirname(tts_path)
+    if tts_dir not in _MKDIR_CACHE:
+        os.makedirs(tts_dir, exist_ok=True)
+        _MKDIR_CACHE.add(tts_dir)
     tts_engine.save_to_file(phrase, tts_path)
     tts_engine.runAndWait()
     return tts_path
@@ -1,7 +1,8 @@
 """Path and filename normalization utilities."""
 
-from pathlib import Path
-from typing import Tuple
+import os
+from os import PathLike
+from typing import Optional, Tuple, Union
 
 
 def normalize_sound_path(path: str) -> str:
@@ -20,26 +21,36 @@ def normalize_sound_path(path: str) -> str:
     return path
 
 
-def get_normalized_keys(path: Path, relative_to: Path = None) -> Tuple[str, str]:
+def get_normalized_keys(
+    path: Union[str, PathLike], relative_to: Optional[Union[str, PathLike]] = None
+) -> Tuple[str, str]:
     """Get normalized keys for a sound file path.
 
+    Works on plain strings rather than Path objects, since this runs once per
+    file when indexing sound directories.
+
     Args:
         path: Path to sound file
         relative_to: Optional base path to make path relative to
 
     Returns:
         Tuple of (relative path key, normalized phrase key)
+
+    Raises:
+        ValueError: If path is not inside relative_to
     """
+    path = os.fspath(path)
+
     # Get relative path without extension
     if relative_to:
-        relative_path = str(path.relative_to(relative_to)).replace(path.suffix, "")
+        base = os.fspath(relative_to).rstrip("/")
+        if not path.startswith(base + "/"):
+            raise ValueError(f"{path} is not in {base}")
+        relative_path = os.path.splitext(path[len(base) + 1 :])[0]
     else:
-        relative_path = path.stem
+        relative_path = os.path.splitext(os.path.basename(path))[0]
 
     # Get normalized phrase version (for matching)
-    if "/" in relative_path:
-        normalized = relative_path.split("/")[-1].replace("-", " ")
-    else:
-        normalized = relative_path.replace("-", " ")
+    normalized = relative_path.rsplit("/", 1)[-1].replace("-", " ")
 
     return relative_path, normalized
@@ -1,35 +1,60 @@
 """Asterisk integration utilities."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
+from types import MappingProxyType
 from .config import Config
-from typing import Dict
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 import os
-import sys
-
-SUPPORTED_ASTERISK_SOUND_EXTENSIONS = [
-    ".ul",
-    ".ulaw",  # uLaw
-    ".al",
-    ".alaw",  # aLaw
-    ".g711",  # G.711
-    ".g723",  # G.723.1
-    ".g726",  # G.726
-    ".g729",  # G.729
-    ".gsm",  # Raw GSM
-    ".ilbc",  # iLBC codec
-    ".pcm",  # Raw PCM
-    ".sln",  # Signed Linear
-    ".vox",  # Dialogic VOX
-    ".wav",  # WAV format
-    ".wav_gsm",  # WAV with GSM encoding
-]
-
-SKIP_PREFIXES = [".", "CREDITS", "LICENSE", "CHANGES", "README"]
-SKIP_SUFFIXES = [".txt"]
-
-NORMALIZATION_BLACKLIST = ["digits", "letters", "phonetic", "silence"]
-
 
+SUPPORTED_ASTERISK_SOUND_EXTENSIONS = frozenset(
+    [
+        ".ul",
+        ".ulaw",  # uLaw
+        ".al",
+        ".alaw",  # aLaw
+        ".g711",  # G.711
+        ".g723",  # G.723.1
+        ".g726",  # G.726
+        ".g729",  # G.729
+        ".gsm",  # Raw GSM
+        ".ilbc",  # iLBC codec
+        ".pcm",  # Raw PCM
+        ".sln",  # Signed Linear
+        ".vox",  # Dialogic VOX
+        ".wav",  # WAV format
+        ".wav_gsm",  # WAV with GSM encoding
+    ]
+)
+
+# Tuples so a single str.startswith/endswith call checks all of them
+SKIP_PREFIXES = (".", "CREDITS", "LICENSE", "CHANGES", "README")
+SKIP_SUFFIXES = (".txt",)
+
+NORMALIZATION_BLACKLIST = frozenset(["digits", "letters", "phonetic", "silence"])
+
+_SEPARATORS_TO_SPACES = str.maketrans("_-", "  ")
+
+# Threads used to scan the subdirectories of a sounds directory
+SCAN_WORKERS = 8
+
+# load_sound_files results keyed by (sounds directory, custom sounds
+# directory, verbose), each (directory modification times, mapping, data
+# derived from the mapping, see sound_files_derived)
+_SOUND_FILES_CACHE = {}
+SOUND_FILES_CACHE_SIZE = 4
+
+
+def _strip_suffix(name: str) -> str:
+    """Strip the extension from a file name the same way Path.stem does."""
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[:dot]
+    return name
+
+
+@lru_cache(maxsize=8192)
 def normalize_phrase(phrase: str) -> str:
     """Normalize a phrase by replacing underscores and hyphens with spaces, converting to lowercase, and remove any path that may exist.
 
@@ -45,27 +70,103 @@ def normalize_phrase(phrase: str) -> str:
     Returns:
         The normalized phrase
     """
-    path = Path(phrase)
+    # Plain string handling equivalent to Path(phrase).parts / .stem, since
+    # this runs for every sound file and phrase lookup
+    parts = [part for part in phrase.split("/") if part and part != "."]
 
     # Check if the path starts with any blacklisted prefixes
-    if any(part in NORMALIZATION_BLACKLIST for part in path.parts):
-        return str(path.with_suffix(""))
+    if not NORMALIZATION_BLACKLIST.isdisjoint(parts):
+        parts[-1] = _strip_suffix(parts[-1])
+        root = phrase[: len(phrase) - len(phrase.lstrip("/"))]
+        # POSIX keeps exactly two leading slashes, otherwise collapses to one
+        if len(root) > 2:
+            root = "/"
+        return root + "/".join(parts)
 
     # Get just the filename without extension or path
-    phrase = path.stem
+    phrase = _strip_suffix(parts[-1]) if parts else ""
 
     # Convert to lowercase
     phrase = phrase.lower()
 
     # Replace underscores and hyphens with spaces
-    phrase = phrase.replace("_", " ").replace("-", " ")
+    phrase = phrase.translate(_SEPARATORS_TO_SPACES)
 
-    # Remove any extra whitespace
-    phrase = " ".join(phrase.split())
+    # Remove any extra whitespace; single words (most sound files) have none
+    if not phrase.isalnum():
+        phrase = " ".join(phrase.split())
 
     return phrase
 
 
+def get_phrase_trie(sounds: Mapping[str, str]) -> Dict:
+    """Get the phrase trie for a sound mapping.
+
+    For a mapping from load_sound_files the trie is built once and kept with
+    the mapping; otherwise it is built on every call.
+
+    Args:
+        sounds: Dictionary mapping normalized phrases to sound file paths
+
+    Returns:
+        The root node of the trie, see build_phrase_trie
+    """
+    return sound_files_derived(sounds, "phrase_trie", build_phrase_trie)
+
+
+def sound_files_derived(
+    sounds: Mapping[str, str], name: str, build: Callable[[Mapping[str, str]], Any]
+) -> Any:
+    """Get data derived from a sound mapping, memoized with the mapping.
+
+    Only mappings returned by load_sound_files are memoized, since they are
+    read-only; the data is dropped along with the mapping.
+
+    Args:
+        sounds: Dictionary mapping normalized phrases to sound file paths
+        name: Name of the derived data
+        build: Function building the data from the mapping
+
+    Returns:
+        The derived data
+    """
+    for _, cached_sounds, derived in _SOUND_FILES_CACHE.values():
+        if cached_sounds is sounds:
+            if name not in derived:
+                derived[name] = build(sounds)
+            return derived[name]
+    return build(sounds)
+
+
+def build_phrase_trie(sounds: Dict[str, str]) -> Dict:
+    """Build a word trie over the normalized phrases in a sound mapping.
+
+    Each node is a dict of word -> child node. A node that completes a phrase
+    also holds the phrase's sound file path under the None key, so the
+    longest phrase can be found by walking words until the trie runs out.
+
+    Examples:
+        {"connected": ..., "connected to": ...} ->
+        {"connected": {None: ".../connected.ulaw", "to": {None: ".../connected-to.ulaw"}}}
+
+    Args:
+        sounds: Dictionary mapping normalized phrases to sound file paths
+
+    Returns:
+        The root node of the trie
+    """
+    root = {}
+    for phrase, sound_file_path in sounds.items():
+        words = phrase.split()
+        if not words:
+            continue
+        node = root
+        for word in words:
+            node = node.setdefault(word, {})
+        node[None] = sound_file_path
+    return root
+
+
 def _create_normalized_phrase_to_sound_file_mapping(
     base_files: Dict[str, str], custom_files: Dict[str, str], verbose: int = 0
 ) -> Dict[str, str]:
@@ -83,6 +184,17 @@ def _create_normalized_phrase_to_sound_file_mapping(
     """
     normalized_phrases = {}
 
+    # Without diagnostics there's nothing to report on collisions, so skip
+    # the per-file membership tests: first base file wins, custom overrides
+    if verbose < 1:
+        for sound_file, sound_file_path in base_files.items():
+            normalized_phrases.setdefault(normalize_phrase(sound_file), sound_file_path)
+        normalized_phrases.update(
+            (normalize_phrase(sound_file), sound_file_path)
+            for sound_file, sound_file_path in custom_files.items()
+        )
+        return normalized_phrases
+
     # Process base files first
     for sound_file, sound_file_path in base_files.items():
         normalized_phrase = normalize_phrase(sound_file)
@@ -112,16 +224,135 @@ def _create_normalized_phrase_to_sound_file_mapping(
     return normalized_phrases
 
 
-def load_sound_files(config: Config, verbose: int = 0) -> Dict[str, str]:
+def _scan_sound_directory(
+    directory: str, base: str
+) -> Tuple[List[Tuple[Optional[str], str]], List[str]]:
+    """List the sound files and subdirectories of a single directory.
+
+    Uses os.scandir so names and types come from the directory listing
+    rather than a Path object and stat() per file.
+
+    Args:
+        directory: The directory to list
+        base: The sounds directory that relative paths are based on
+
+    Returns:
+        Tuple of (list of (relative path without extension, or None if the
+        file isn't a supported sound file, full path), list of subdirectories)
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = list(it)
+    except PermissionError:
+        return [], []
+
+    found = []
+    subdirectories = []
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir(follow_symlinks=False):
+            subdirectories.append(entry.path)
+
+        if name.startswith(SKIP_PREFIXES) or name.endswith(SKIP_SUFFIXES):
+            continue
+
+        # skip directories
+        if entry.is_dir():
+            continue
+
+        # Check if the file extension is supported by Asterisk
+        stem, ext = os.path.splitext(entry.path)
+        if ext.lower() in SUPPORTED_ASTERISK_SOUND_EXTENSIONS:
+            found.append((stem[len(base) + 1 :], entry.path))
+        else:
+            found.append((None, entry.path))
+
+    return found, subdirectories
+
+
+def _scan_sound_tree(
+    directory: str, base: str
+) -> Tuple[List[Tuple[Optional[str], str]], List[Tuple[str, Optional[int]]]]:
+    """List the sound files in a directory tree.
+
+    Like rglob, each directory's entries are listed before descending into
+    its subdirectories, and symlinked directories aren't followed.
+
+    Args:
+        directory: The top of the tree to list
+        base: The sounds directory that relative paths are based on
+
+    Returns:
+        Tuple of (list of files as returned by _scan_sound_directory, list of
+        (directory, modification time) for every directory listed)
+    """
+    found = []
+    stamps = []
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        # Stat before listing, so a change made during the scan is seen later
+        stamps.append((current, _directory_mtime(current)))
+        files, subdirectories = _scan_sound_directory(current, base)
+        found.extend(files)
+        stack.extend(reversed(subdirectories))
+    return found, stamps
+
+
+def _directory_mtime(directory: str) -> Optional[int]:
+    """Get the modification time of a directory, or None if it can't be read."""
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+def load_sound_files(config: Config, verbose: int = 0) -> Mapping[str, str]:
     """Load available sound files from configured directories.
 
+    Results are memoized per process and reused until a file is added to or
+    removed from either directory tree, which changes the modification time
+    of the directory holding it. Files changed in place don't invalidate the
+    mapping, since it only records their paths. The returned mapping is
+    shared, so it is read-only.
+
     Args:
         config: The configuration object
         verbose: The verbosity level
 
     Returns:
-        A dictionary of available sound files, keyed by the normalized phrase and a value of the sound file path
+        A read-only mapping of available sound files, keyed by the normalized phrase and a value of the sound file path
+    """
+    key = (config.sounds_directory, config.custom_sounds_directory, verbose)
+    cached = _SOUND_FILES_CACHE.get(key)
+    if cached is not None:
+        stamps, sounds, _ = cached
+        if all(_directory_mtime(d) == mtime for d, mtime in stamps):
+            return sounds
+
+    stamps, sounds = _load_sound_files(
+        config.sounds_directory, config.custom_sounds_directory, verbose
+    )
+    _SOUND_FILES_CACHE.pop(key, None)
+    _SOUND_FILES_CACHE[key] = (stamps, sounds, {})
+    if len(_SOUND_FILES_CACHE) > SOUND_FILES_CACHE_SIZE:
+        del _SOUND_FILES_CACHE[next(iter(_SOUND_FILES_CACHE))]
+    return sounds
+
+
+def _load_sound_files(
+    sounds_directory: Path,
+    custom_sounds_directory: Path,
+    verbose: int = 0,
+) -> Tuple[List[Tuple[str, Optional[int]]], Mapping[str, str]]:
+    """Load sound files from the given directories.
+
+    Returns:
+        Tuple of (list of (directory, modification time) for the directories
+        the mapping was built from, read-only sound mapping as returned by
+        load_sound_files)
     """
+    stamps = []
     base_sounds_directory_files = {}
     custom_sounds_directory_files = {}
 
@@ -132,34 +363,34 @@ def load_sound_files(config: Config, verbose: int = 0) -> Dict[str, str]:
         if not directory.exists():
             if verbose >= 1:
                 print(f"Directory {directory} does not exist")
+            # Creating it invalidates the mapping
+            stamps.append((str(directory), None))
             return
 
         # Check if directory is readable
         if not os.access(directory, os.R_OK):
             raise PermissionError(f"Cannot read sounds directory: {directory}")
 
-        for path in directory.rglob("*"):
-            if any(path.name.startswith(prefix) for prefix in SKIP_PREFIXES) or any(
-                path.name.endswith(suffix) for suffix in SKIP_SUFFIXES
-            ):
-                continue
-
-            # skip directories
-            if path.is_dir():
-                continue
-
-            # Check if the file extension is supported by Asterisk
-            if path.suffix.lower() in SUPPORTED_ASTERISK_SOUND_EXTENSIONS:
-                # Check if file is readable
-                if not os.access(path, os.R_OK):
-                    print(f"Warning: Cannot read sound file: {path}", file=sys.stderr)
-                    continue
-
-                relative_path = str(path.relative_to(directory).with_suffix(""))
-                files_dict[relative_path] = str(path)
-            else:
+        # Subdirectories (digits, letters, ...) are scanned in parallel so
+        # their directory reads overlap. Results are merged in listing order,
+        # which keeps the same files winning as a sequential walk.
+        base = str(directory)
+        stamps.append((base, _directory_mtime(base)))
+        found, subdirectories = _scan_sound_directory(base, base)
+        if subdirectories:
+            workers = min(SCAN_WORKERS, len(subdirectories))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for files, tree_stamps in executor.map(
+                    partial(_scan_sound_tree, base=base), subdirectories
+                ):
+                    found.extend(files)
+                    stamps.extend(tree_stamps)
+
+        for relative_path, path in found:
+            if relative_path is None:
                 print(f"Skipping unsupported sound file: {path}")
-
+                continue
+            files_dict[relative_path] = path
             if verbose >= 3:
                 print(f"  {relative_path} -> {path}")
 
@@ -167,13 +398,11 @@ def load_sound_files(config: Config, verbose: int = 0) -> Dict[str, str]:
             print(f"Loaded {len(files_dict)} sound files from {directory}")
 
     # Load from base and custom sounds directories
-    load_from_directory(config.sounds_directory, base_sounds_directory_files)
-    load_from_directory(config.custom_sounds_directory, custom_sounds_directory_files)
+    load_from_directory(sounds_directory, base_sounds_directory_files)
+    load_from_directory(custom_sounds_directory, custom_sounds_directory_files)
 
     if len(base_sounds_directory_files) == 0:
-        raise ValueError(
-            f"No sound files found in base directory: {config.sounds_directory}"
-        )
+        raise ValueError(f"No sound files found in base directory: {sounds_directory}")
 
     if verbose >= 2:
         print(f"Available base sounds: {len(base_sounds_directory_files)}")
@@ -193,4 +422,4 @@ def load_sound_files(config: Config, verbose: int = 0) -> Dict[str, str]:
         )
     )
 
-    return normalized_phrase_to_sound_file_mapping
+    return stamps, MappingProxyType(normalized_phrase_to_sound_file_mapping)
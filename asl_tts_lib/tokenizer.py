@@ -1,17 +1,38 @@
 """Text tokenization utilities for ASL TTS."""
 
+import re
 from typing import List
 from .constants import PAUSE_CHARS
 
+# First pass: a braced group up to its closing brace (or the end of the text
+# if it's never closed, whitespace included), or a run of text up to the
+# next whitespace or opening brace. Runs that are word tokens (letters,
+# digits and hyphens, see _is_word_token) are captured separately so the
+# second pass doesn't have to check them again. [^\W_] is a str.isalnum()
+# character.
+_CHUNK_RE = re.compile(
+    r"(\[[^\]]*\]|\{[^}]*\}|\([^)]*\))"
+    r"|[\[{(].*"
+    r"|(-*[^\W_](?:[^\W_]|-)*)(?=[\s\[{(]|\Z)"
+    r"|[^\s\[{(]+",
+    re.DOTALL,
+)
+
+# Second pass: letters/digits continuing with letters, digits and hyphens, or
+# any other single character ([^\W_] is a str.isalnum() character)
+_PIECE_RE = re.compile(r"[^\W_](?:[^\W_]|-)*|.", re.DOTALL)
+
+_BRACE_OPENS = frozenset("[{(")
+
+# Opening brace -> (opening, closing) braces
+_BRACES = {"[": ("[", "]"), "{": ("{", "}"), "(": ("(", ")")}
+
 
 def _is_word_token(token: str) -> bool:
     """Check if a token is a word (contains letters/numbers and optionally hyphens)."""
-    if not token:
-        return False
-
-    return all(c.isalnum() or c == "-" for c in token) and any(
-        c.isalnum() for c in token
-    )
+    # str.isalnum() is False for an empty string, so this also requires at
+    # least one letter or digit
+    return token.replace("-", "").isalnum()
 
 
 def _normalize_braced_content(text: str, brace_type: str) -> str:
@@ -27,16 +48,22 @@ def _normalize_braced_content(text: str, brace_type: str) -> str:
     # Strip outer braces
     inner = text[1:-1]
 
+    # Already normalized, the usual case. isprintable() is False for every
+    # whitespace character other than a plain space.
+    if (
+        inner.isprintable()
+        and "  " not in inner
+        and inner[:1] != " "
+        and inner[-1:] != " "
+    ):
+        return text
+
     # Normalize whitespace - collapse multiple spaces and trim
     normalized = " ".join(inner.split())
 
     # Add braces back
-    if brace_type == "[":
-        return f"[{normalized}]"
-    elif brace_type == "{":
-        return f"{{{normalized}}}"
-    else:  # '('
-        return f"({normalized})"
+    opening, closing = _BRACES.get(brace_type, _BRACES["("])
+    return opening + normalized + closing
 
 
 def tokenize_text(text: str, verbose: int = 0) -> List[str]:
@@ -62,114 +89,73 @@ def tokenize_text(text: str, verbose: int = 0) -> List[str]:
     if verbose >= 2:
         print(f"Tokenizing text: {text}")
 
-    tokens = []
-    current_token = ""
-    inside_braces = False
-    brace_type = None  # Track which type of brace we're inside
-
     # First pass: split on spaces and handle braced content
-    for char in text:
-        if inside_braces:
-            current_token += char
-            # Check for matching closing brace
-            if (
-                (char == "]" and brace_type == "[")
-                or (char == "}" and brace_type == "{")
-                or (char == ")" and brace_type == "(")
-            ):
-                # Normalize the braced content before adding
-                normalized = _normalize_braced_content(current_token, brace_type)
-                tokens.append(normalized)
-                if verbose >= 2:
-                    print(f"Found braced content: {normalized}")
-                current_token = ""
-                inside_braces = False
-                brace_type = None
-            continue
-
-        if char in "[{(":
-            if current_token:
-                tokens.append(current_token)
-                if verbose >= 2:
-                    print(f"Adding token before brace: {current_token}")
-            current_token = char
-            inside_braces = True
-            brace_type = char
-            continue
-
-        if char.isspace():
-            if current_token:
-                tokens.append(current_token)
-                if verbose >= 2:
-                    print(f"Adding token before space: {current_token}")
-                current_token = ""
+    tokens = []
+    word_tokens = set()
+    for match in _CHUNK_RE.finditer(text):
+        token = match.group()
+        if match.group(1):
+            # Normalize the braced content before adding
+            normalized = _normalize_braced_content(token, token[0])
+            tokens.append(normalized)
+            if verbose >= 2:
+                print(f"Found braced content: {normalized}")
             continue
 
-        current_token += char
-
-    if current_token:
-        tokens.append(current_token)
+        tokens.append(token)
+        if match.group(2):
+            word_tokens.add(token)
         if verbose >= 2:
-            print(f"Adding final token: {current_token}")
+            following = text[match.end() : match.end() + 1]
+            if not following:
+                print(f"Adding final token: {token}")
+            elif following in _BRACE_OPENS:
+                print(f"Adding token before brace: {token}")
+            else:
+                print(f"Adding token before space: {token}")
 
     # Second pass: handle special characters in non-word tokens
     final_tokens = []
     for token in tokens:
-        if token.startswith("[") or token.startswith("{") or token.startswith("("):
+        # First pass tokens are never empty
+        if token[0] in _BRACE_OPENS:
             final_tokens.append(token)
             if verbose >= 2:
                 print(f"Keeping braced token: {token}")
             continue
 
-        if _is_word_token(token):
+        if token in word_tokens:
             final_tokens.append(token)
             if verbose >= 2:
                 print(f"Keeping word token: {token}")
             continue
 
-        # Split special characters
-        current = ""
-        for char in token:
-            if char.isalnum() or char == "-":
-                # If we see a hyphen that's not part of a word, treat it as a pause char
-                if char == "-" and (
-                    not current or not any(c.isalnum() for c in current)
-                ):
-                    if current:
-                        final_tokens.append(current)
-                        if verbose >= 2:
-                            print(f"Adding current before hyphen: {current}")
-                        current = ""
-                    # Only add the hyphen if it's not already the last token
-                    if not final_tokens or final_tokens[-1] != "-":
-                        final_tokens.append("-")
-                        if verbose >= 2:
-                            print("Adding hyphen token")
-                else:
-                    current += char
-            else:
-                if current:
-                    final_tokens.append(current)
-                    if verbose >= 2:
-                        print(f"Adding current before special: {current}")
-                    current = ""
-                if char in PAUSE_CHARS:
-                    # Only add pause char if it's not already the last token
-                    if not final_tokens or final_tokens[-1] != char:
-                        final_tokens.append(char)
-                        if verbose >= 2:
-                            print(f"Adding pause char: {char}")
-                else:
+        # Split special characters, keeping runs of letters/digits (and
+        # hyphens after them) together
+        for piece in _PIECE_RE.finditer(token):
+            char = piece.group()
+            if len(char) > 1 or char.isalnum():
+                final_tokens.append(char)
+                if verbose >= 2:
+                    if piece.end() == len(token):
+                        print(f"Adding final current: {char}")
+                    else:
+                        print(f"Adding current before special: {char}")
+            elif char in PAUSE_CHARS:
+                # Only add pause char if it's not already the last token
+                if not final_tokens or final_tokens[-1] != char:
                     final_tokens.append(char)
                     if verbose >= 2:
-                        print(f"Adding special char: {char}")
-
-        if current:
-            final_tokens.append(current)
-            if verbose >= 2:
-                print(f"Adding final current: {current}")
+                        if char == "-":
+                            print("Adding hyphen token")
+                        else:
+                            print(f"Adding pause char: {char}")
+            else:
+                final_tokens.append(char)
+                if verbose >= 2:
+                    print(f"Adding special char: {char}")
 
-    result = [t for t in final_tokens if t]
+    # Both passes only ever produce non-empty tokens
     if verbose >= 1:
-        print(f"Final tokens: {result}")
-    return result
+        print(f"Final tokens: {final_tokens}")
+    return final_tokens
@@ -2,12 +2,27 @@
 
 import os
 import subprocess
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Set, Tuple
 from .utils import sanitize_filename_with_hash, normalize_key
 from .config import Config
 import sys
 
+# Sound files found or generated by generate_missing_phrase, keyed by
+# (phrase, custom sounds directory, max filename words), most recent last
+_PHRASE_PATH_CACHE = OrderedDict()
+PHRASE_PATH_CACHE_SIZE = 1024
+
+# Most asl-tts processes generate_missing_phrases runs at once
+TTS_WORKERS = 8
+
+# Names of the .ul files in each custom sounds directory, built on first use
+_CUSTOM_SOUND_INDEXES: Dict[str, Set[str]] = {}
+
 
 def should_generate_phrase(phrase: str, verbose: int = 0) -> bool:
     """Determine if a phrase should be generated via TTS.
@@ -27,39 +42,45 @@ def should_generate_phrase(phrase: str, verbose: int = 0) -> bool:
         - Allow normal words and hyphenated words
         - Allow phrases in parentheses
     """
+    allowed, reason = _phrase_generation_rule(phrase)
+    if verbose >= 2:
+        print(f"{reason}: {phrase}")
+    return allowed
+
+
+@lru_cache(maxsize=4096)
+def _phrase_generation_rule(phrase: str) -> Tuple[bool, str]:
+    """Apply the should_generate_phrase rules to a phrase.
+
+    Phrases repeat across announcements, so the decision is cached.
+
+    Args:
+        phrase: Phrase to check
+
+    Returns:
+        Tuple of (whether to generate TTS, reason for verbose output)
+    """
     # Always allow phrases in parentheses
-    if phrase.startswith("(") and phrase.endswith(")"):
-        if verbose >= 2:
-            print(f"Allowing TTS for parenthesized phrase: {phrase}")
-        return True
+    if phrase[:1] == "(" and phrase[-1:] == ")":
+        return True, "Allowing TTS for parenthesized phrase"
 
     # Skip pure numbers
     if phrase.replace("-", "").isdigit():
-        if verbose >= 2:
-            print(f"Skipping TTS for pure number: {phrase}")
-        return False
+        return False, "Skipping TTS for pure number"
 
     # Skip all uppercase phrases
     if phrase.isupper():
-        if verbose >= 2:
-            print(f"Skipping TTS for uppercase phrase: {phrase}")
-        return False
+        return False, "Skipping TTS for uppercase phrase"
 
     # Skip single characters
     if len(phrase) == 1:
-        if verbose >= 2:
-            print(f"Skipping TTS for single character: {phrase}")
-        return False
+        return False, "Skipping TTS for single character"
 
     # Allow if contains any lowercase
     if any(c.islower() for c in phrase):
-        if verbose >= 2:
-            print(f"Allowing TTS for phrase with lowercase: {phrase}")
-        return True
+        return True, "Allowing TTS for phrase with lowercase"
 
-    if verbose >= 2:
-        print(f"Skipping TTS for phrase: {phrase}")
-    return False
+    return False, "Skipping TTS for phrase"
 
 
 def generate_missing_phrase(
@@ -76,68 +97,284 @@ def generate_missing_phrase(
     Returns:
         Path to generated sound file if successful, None otherwise
     """
+    return generate_missing_phrases([(phrase, normalized_phrase)], config, verbose)[0]
+
+
+def generate_missing_phrases(
+    items: List[Tuple[str, str]],
+    config: Config,
+    verbose: int = 0,
+    workers: Optional[int] = None,
+) -> List[Optional[str]]:
+    """Generate TTS for several missing phrases.
+
+    Phrases that still need generating are run through asl-tts in parallel,
+    one process per phrase, unless config.tts_parallel is off.
+
+    Args:
+        items: List of (original phrase, normalized phrase), as for
+            generate_missing_phrase
+        config: Configuration object
+        verbose: Verbosity level (0=none, 1=basic, 2=detailed)
+        workers: Most asl-tts processes to run at once, default the smaller
+            of TTS_WORKERS and the number of CPUs
+
+    Returns:
+        List with the path to each phrase's sound file, or None where it
+        couldn't be generated
+    """
+    results = [None] * len(items)
+
+    # Phrases found or generated earlier in this process are still there
+    pending = []
+    for index, (phrase, _) in enumerate(items):
+        cache_key = _phrase_cache_key(phrase, config)
+        cached_path = _PHRASE_PATH_CACHE.get(cache_key)
+        if cached_path is not None:
+            _PHRASE_PATH_CACHE.move_to_end(cache_key)
+            if verbose >= 1:
+                print(f"Found existing TTS file for phrase: {phrase}")
+            results[index] = cached_path
+        else:
+            pending.append(index)
+
+    if not pending:
+        return results
+
     # Check if custom directory exists and is writable
     if not config.custom_sounds_directory.exists():
         try:
             config.custom_sounds_directory.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             print(f"Error creating custom sounds directory: {e}", file=sys.stderr)
-            return None
+            return results
 
     if not os.access(config.custom_sounds_directory, os.W_OK):
         print(
             f"Error: Cannot write to custom sounds directory: {config.custom_sounds_directory}",
             file=sys.stderr,
         )
-        return None
+        return results
 
     custom_dir = config.custom_sounds_directory
+    sound_index = _CUSTOM_SOUND_INDEXES.get(str(custom_dir))
+    if sound_index is None:
+        sound_index = build_custom_sound_index(custom_dir)
+        _CUSTOM_SOUND_INDEXES[str(custom_dir)] = sound_index
 
-    # For phrases in parentheses, strip them and use normalized version
-    if phrase.startswith("(") and phrase.endswith(")"):
-        # Strip parentheses and normalize
-        inner_phrase = phrase[1:-1]
-        normalized = normalize_key(inner_phrase)
-    else:
-        # For regular phrases, use the phrase directly but normalized
-        normalized = normalize_key(phrase)
-
-    # Create sanitized filename
-    base_filename = sanitize_filename_with_hash(
-        normalized, config.max_phrase_words_for_filenames
-    )
-    base_path = custom_dir / base_filename
-
-    # Check if file already exists
-    if base_path.with_suffix(".ul").exists():
-        if not os.access(base_path.with_suffix(".ul"), os.R_OK):
-            print(
-                f"Error: Cannot read existing TTS file: {base_path.with_suffix('.ul')}",
-                file=sys.stderr,
+    # Phrases that need generating, by output path so that phrases sharing a
+    # file are only generated once
+    jobs = {}
+    for index in pending:
+        phrase = items[index][0]
+
+        # For phrases in parentheses, strip them and use normalized version
+        if phrase[:1] == "(" and phrase[-1:] == ")":
+            # Strip parentheses and normalize
+            tts_text = phrase[1:-1]
+        else:
+            # For regular phrases, use the phrase directly but normalized
+            tts_text = phrase
+        normalized = normalize_key(tts_text)
+
+        # Create sanitized filename
+        base_filename = sanitize_filename_with_hash(
+            normalized, config.max_phrase_words_for_filenames
+        )
+        base_path = custom_dir / base_filename
+        sound_file = base_path.with_suffix(".ul")
+
+        if base_path in jobs:
+            jobs[base_path][1].append(index)
+            continue
+
+        # Check if file already exists. The index is trusted; if a file has
+        # been removed since, forget_phrase_file drops it once opening fails.
+        sound_name = sound_file.name
+        if sound_name in sound_index:
+            if verbose >= 1:
+                print(f"Found existing TTS file for phrase: {phrase}")
+            results[index] = _cache_phrase_path(
+                _phrase_cache_key(phrase, config), str(sound_file)
             )
-            return None
+            continue
 
-        if verbose >= 1:
-            print(f"Found existing TTS file for phrase: {phrase}")
-        return str(base_path.with_suffix(".ul"))
+        jobs[base_path] = (tts_text, [index])
 
-    # Generate TTS using configured command
+    def job_done(base_path, indexes):
+        # Return path with .ul since we know asl-tts adds it
+        sound_file = base_path.with_suffix(".ul")
+        sound_index.add(sound_file.name)
+        for index in indexes:
+            results[index] = str(sound_file)
+
+    def run_job(job):
+        base_path, (tts_text, indexes) = job
+        phrase = items[indexes[0]][0]
+        if _run_tts(config.asl_tts_bin, tts_text, base_path, phrase, verbose):
+            job_done(base_path, indexes)
+
+    # A single batch run pays the TTS engine's startup once for all phrases
+    if len(jobs) > 1 and config.asl_tts_supports_batch:
+        if _run_tts_batch(config.asl_tts_bin, jobs, verbose):
+            # Phrases the batch run didn't produce get a run of their own
+            remaining_jobs = {}
+            for base_path, (tts_text, indexes) in jobs.items():
+                phrase = items[indexes[0]][0]
+                if base_path.with_suffix(".ul").exists():
+                    if verbose >= 1:
+                        print(f"Generated TTS file for phrase: {phrase}")
+                    job_done(base_path, indexes)
+                else:
+                    if verbose >= 1:
+                        print(f"Batch TTS didn't generate phrase: {phrase}")
+                    remaining_jobs[base_path] = (tts_text, indexes)
+            jobs = remaining_jobs
+        elif verbose >= 1:
+            print("Falling back to one asl-tts run per phrase")
+
+    if not config.tts_parallel:
+        workers = 1
+    elif workers is None:
+        workers = min(TTS_WORKERS, os.cpu_count() or 1)
+
+    if len(jobs) == 1 or workers <= 1:
+        for job in jobs.items():
+            run_job(job)
+    elif jobs:
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as executor:
+            list(executor.map(run_job, jobs.items()))
+
+    for index in pending:
+        if results[index] is not None:
+            _cache_phrase_path(
+                _phrase_cache_key(items[index][0], config), results[index]
+            )
+
+    return results
+
+
+def forget_phrase_file(path: str) -> None:
+    """Forget a phrase sound file that turned out to be missing or unreadable.
+
+    The next generate_missing_phrases call for its phrase generates it again.
+
+    Args:
+        path: Sound file path returned by generate_missing_phrases
+    """
+    sound_index = _CUSTOM_SOUND_INDEXES.get(str(Path(path).parent))
+    if sound_index is not None:
+        sound_index.discard(Path(path).name)
+    for cache_key in [k for k, v in _PHRASE_PATH_CACHE.items() if v == path]:
+        del _PHRASE_PATH_CACHE[cache_key]
+
+
+def build_custom_sound_index(custom_dir: Path) -> Set[str]:
+    """List the names of the .ul files in a custom sounds directory.
+
+    Args:
+        custom_dir: Custom sounds directory
+
+    Returns:
+        Set of file names, empty if the directory can't be read
+    """
     try:
-        tts_bin = config.asl_tts_bin
+        with os.scandir(custom_dir) as it:
+            return {entry.name for entry in it if entry.name.endswith(".ul")}
+    except OSError:
+        return set()
+
 
-        # For phrases, use the inner content without parentheses
-        tts_text = inner_phrase if phrase.startswith("(") else phrase
+def _run_tts(
+    tts_bin: str, tts_text: str, base_path: Path, phrase: str, verbose: int = 0
+) -> bool:
+    """Run asl-tts to generate a phrase's sound file.
 
+    Args:
+        tts_bin: asl-tts binary
+        tts_text: Text to speak
+        base_path: Output path without the .ul extension asl-tts adds
+        phrase: Original phrase, for messages
+        verbose: Verbosity level (0=none, 1=basic, 2=detailed)
+
+    Returns:
+        True if the sound file was generated
+    """
+    # Generate TTS using configured command
+    try:
         cmd = [tts_bin, "-n", "1", "-t", tts_text, "-f", str(base_path)]
         if verbose >= 2:
             print(f"Running TTS command: {' '.join(cmd)}")
         subprocess.run(cmd, check=True)
         if verbose >= 1:
             print(f"Generated TTS file for phrase: {phrase}")
-        # Return path with .ul since we know asl-tts adds it
-        return str(base_path.with_suffix(".ul"))
+        return True
     except subprocess.CalledProcessError as e:
         if verbose >= 1:
             print(f"Failed to generate TTS for phrase: {phrase}")
             print(f"Error: {e}")
-        return None
+        return False
+
+
+def _run_tts_batch(
+    tts_bin: str, jobs: Dict[Path, Tuple[str, List[int]]], verbose: int = 0
+) -> bool:
+    """Run asl-tts once in batch mode to generate several phrases' sound files.
+
+    Requires an asl-tts that accepts --batch, see asl_tts_supports_batch.
+
+    Args:
+        tts_bin: asl-tts binary
+        jobs: Map of output path without the .ul extension to (text to
+            speak, phrase indexes)
+        verbose: Verbosity level (0=none, 1=basic, 2=detailed)
+
+    Returns:
+        True if asl-tts ran successfully
+    """
+    # Manifest is one "text<TAB>output path without suffix" line per phrase
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".tsv", prefix="asl-tts-", delete=False
+    ) as manifest:
+        for base_path, (tts_text, _) in jobs.items():
+            tts_text = " ".join(tts_text.split())
+            manifest.write(f"{tts_text}\t{base_path}\n")
+
+    try:
+        cmd = [tts_bin, "--batch", manifest.name]
+        if verbose >= 2:
+            print(f"Running TTS command: {' '.join(cmd)}")
+        subprocess.run(cmd, check=True)
+        return True
+    except (OSError, subprocess.CalledProcessError) as e:
+        if verbose >= 1:
+            print(f"Failed to generate batch TTS: {e}")
+        return False
+    finally:
+        os.unlink(manifest.name)
+
+
+def _phrase_cache_key(phrase: str, config: Config) -> Tuple[str, str, int]:
+    """Build the _PHRASE_PATH_CACHE key for a phrase."""
+    return (
+        phrase,
+        str(config.custom_sounds_directory),
+        config.max_phrase_words_for_filenames,
+    )
+
+
+def _cache_phrase_path(cache_key: Tuple[str, str, int], path: str) -> str:
+    """Remember the sound file for a phrase, evicting the least recently used.
+
+    Args:
+        cache_key: Key from _phrase_cache_key
+        path: Path to the phrase's sound file
+
+    Returns:
+        The path
+    """
+    _PHRASE_PATH_CACHE[cache_key] = path
+    _PHRASE_PATH_CACHE.move_to_end(cache_key)
+    if len(_PHRASE_PATH_CACHE) > PHRASE_PATH_CACHE_SIZE:
+        _PHRASE_PATH_CACHE.popitem(last=False)
+    return path
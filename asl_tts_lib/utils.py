@@ -1,10 +1,33 @@
+import os
 import re
 import hashlib
+import shutil
 import sys
+import time
 from pathlib import Path
-from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Iterable
 
+# Text that is already a single safe filename component
+_SAFE_FILENAME_RE = re.compile(r"[a-z0-9-]*[a-z0-9]")
 
+# Filename sanitizing, see sanitize_filename_with_hash
+_SPACES_UNDERSCORES_RE = re.compile(r"[ _]+")
+_NON_FILENAME_CHARS_RE = re.compile(r"[^a-z0-9\-]")
+
+# The filename hash isn't a security feature; saying so (Python 3.9+) keeps
+# md5 available on FIPS-restricted OpenSSL builds
+try:
+    hashlib.md5(usedforsecurity=False)
+    _MD5_ARGS = {"usedforsecurity": False}
+except TypeError:
+    _MD5_ARGS = {}
+
+# Anything but letters, digits and spaces ([\W_] is not str.isalnum())
+_NON_KEY_CHARS_RE = re.compile(r"[^\w ]|_")
+
+
+@lru_cache(maxsize=4096)
 def normalize_key(key: str) -> str:
     """Normalize a key by converting to lowercase and handling special cases.
 
@@ -16,20 +39,16 @@ def normalize_key(key: str) -> str:
         and consistent casing
     """
     key = key.lower()
-    if any(c in key for c in ",."):
+    if "," in key or "." in key:
         return key
 
-    parts = key.replace("-", " ").replace("_", " ").split()
-    return " ".join(
-        (
-            part
-            if part.isdigit()
-            else "".join(c for c in part if c.isalnum() or c.isspace())
-        )
-        for part in parts
-    ).strip()
+    # Single-space the words, then drop everything but letters and digits
+    # from each of them in one pass (a word with neither leaves its spaces)
+    key = " ".join(key.replace("-", " ").replace("_", " ").split())
+    return _NON_KEY_CHARS_RE.sub("", key).strip()
 
 
+@lru_cache(maxsize=4096)
 def sanitize_filename_with_hash(text: str, max_words: int) -> str:
     """Create a safe filename from text with hash.
 
@@ -40,6 +59,10 @@ def sanitize_filename_with_hash(text: str, max_words: int) -> str:
     Returns:
         A sanitized filename with an MD5 hash appended only if text exceeds max_words
     """
+    # Most seeded and matched names are already safe, single-word filenames
+    if _SAFE_FILENAME_RE.fullmatch(text):
+        return text
+
     words = text.split()
     needs_hash = len(words) > max_words
 
@@ -50,8 +73,8 @@ def sanitize_filename_with_hash(text: str, max_words: int) -> str:
         shortened_text = " ".join(words)
 
     # Sanitize by removing all non-alphanumeric chars except hyphens
-    sanitized = re.sub(
-        r"[^a-z0-9\-]", "", re.sub(r"[ _]+", "-", shortened_text.lower())
+    sanitized = _NON_FILENAME_CHARS_RE.sub(
+        "", _SPACES_UNDERSCORES_RE.sub("-", shortened_text.lower())
     )
 
     # Remove any trailing hyphen
@@ -63,12 +86,128 @@ def sanitize_filename_with_hash(text: str, max_words: int) -> str:
 
     # Only add hash if we truncated the text
     if needs_hash:
-        hash_digest = hashlib.md5(text.encode("utf-8")).hexdigest()[:8]
+        hash_digest = hashlib.md5(text.encode("utf-8"), **_MD5_ARGS).hexdigest()[:8]
         return f"{sanitized}-{hash_digest}"
     else:
         return sanitized
 
 
+def content_cache_key(parts: Iterable[str]) -> str:
+    """Create a cache key from the inputs that determine the generated audio.
+
+    Args:
+        parts: The strings that fully describe the audio (e.g. matched sound files)
+
+    Returns:
+        A short hex digest that is identical for identical inputs
+    """
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def files_cache_key(paths: Iterable[str]) -> str:
+    """Create a cache key from input files, including their sizes and mtimes.
+
+    A file regenerated in place (e.g. by asl-tts-seed --force) changes the
+    key, so audio built from the old version isn't reused.
+
+    Args:
+        paths: The input files, in order
+
+    Returns:
+        A short hex digest, as from content_cache_key
+    """
+    parts = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            parts.append(path)
+            continue
+        parts.append(f"{path}\0{st.st_size}\0{st.st_mtime_ns}")
+    return content_cache_key(parts)
+
+
+def touch_cache_file(cache_file: Path) -> bool:
+    """Mark a cache file as just used, if it exists.
+
+    cache_cleanup evicts by modification time, so touching entries on every
+    hit keeps eviction least-recently-used.
+
+    Args:
+        cache_file: The content-keyed cache file
+
+    Returns:
+        True if cache_file exists
+    """
+    try:
+        os.utime(cache_file)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def link_cache_alias(cache_file: Path, alias: Path, verbose: int = 0) -> None:
+    """Point a human-readable name in the cache directory at a content-keyed file.
+
+    Args:
+        cache_file: The content-keyed cache file
+        alias: The readable path to link to cache_file
+        verbose: Verbosity level
+    """
+    if alias == cache_file:
+        return
+
+    try:
+        if alias.is_symlink() or alias.exists():
+            alias.unlink()
+        alias.symlink_to(cache_file.name)
+        if verbose >= 2:
+            print(f"Linked cache alias: {alias} -> {cache_file.name}")
+    except OSError as e:
+        if verbose >= 1:
+            print(
+                f"Warning: Could not create cache alias {alias}: {e}", file=sys.stderr
+            )
+
+
+def fast_materialize(src: Path, dst: Path) -> None:
+    """Copy src to dst as cheaply as possible.
+
+    Tries an in-kernel copy with copy_file_range, which filesystems that
+    support it may turn into a reflink, and falls back to shutil.copy2. dst
+    always gets its own inode so that writing to it later can't change src.
+    Any existing file at dst is replaced, and a directory dst receives a file
+    named after src, as with shutil.copy2.
+
+    Args:
+        src: Source file, typically an immutable cache file
+        dst: Destination path
+    """
+    src, dst = Path(src), Path(dst)
+    if dst.is_dir():
+        dst = dst / src.name
+    src = Path(os.path.realpath(src))
+
+    if os.path.realpath(dst) == str(src):
+        return
+
+    # Replace rather than truncate, dst may be a hard link to src
+    if dst.is_symlink() or dst.exists():
+        dst.unlink()
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                    pass
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+
+    shutil.copy2(src, dst)
+
+
 def cache_cleanup(
     cache_dir: str, max_age_days: int, max_files: int, verbose: int = 0
 ) -> None:
@@ -83,6 +222,7 @@ def cache_cleanup(
     Note:
         First removes files older than max_age_days, then removes oldest files
         if count exceeds max_files. Only processes files with .ul extension.
+        Symlinked aliases aren't counted, and are removed once their target is.
         Setting either max_age_days or max_files to -1 disables that limit.
     """
     # If both limits are disabled, nothing to do
@@ -91,36 +231,60 @@ def cache_cleanup(
             print("Cache cleanup skipped - no limits set")
         return
 
-    cache_path = Path(cache_dir)
-
     try:
+        # List the cache once; DirEntry keeps the lstat result, and the
+        # count limit below applies to whatever the age limit leaves.
+        # Readable aliases (symlinks) don't count towards the limits; they
+        # go when the file they point at does.
+        files = []
+        aliases = []
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".ul") or entry.name.startswith("."):
+                    continue
+                if entry.is_symlink():
+                    aliases.append(Path(entry.path))
+                elif not entry.is_dir(follow_symlinks=False):
+                    files.append(
+                        (Path(entry.path), entry.stat(follow_symlinks=False).st_mtime)
+                    )
+
         # Delete old files first if age limit is enabled
         if max_age_days != -1:
-            now = datetime.now()
-            cutoff_date = now - timedelta(days=max_age_days)
-            files = sorted(
-                [(f, f.stat().st_mtime) for f in cache_path.glob("*")],
-                key=lambda x: x[1],
-            )
-            for file_path, mtime in files:
-                if datetime.fromtimestamp(mtime) < cutoff_date:
-                    if verbose:
-                        print(f"Deleting (age): {file_path}")
-                    file_path.unlink(missing_ok=True)
+            # Compare raw timestamps rather than building a datetime per file
+            cutoff = time.time() - max_age_days * 86400
+            expired_files = []
+            remaining_files = []
+            for file_info in files:
+                if file_info[1] < cutoff:
+                    expired_files.append(file_info)
+                else:
+                    remaining_files.append(file_info)
+            expired_files.sort(key=lambda x: x[1])
+            for file_path, _ in expired_files:
+                if verbose:
+                    print(f"Deleting (age): {file_path}")
+                file_path.unlink(missing_ok=True)
+            files = remaining_files
 
-        # Then check if we need to delete any files based on count if count limit is enabled
+        # Then check if we need to delete any files based on count if count
+        # limit is enabled. Only a cache over the limit needs sorting.
         if max_files != -1:
-            remaining_files = sorted(
-                [(f, f.stat().st_mtime) for f in cache_path.glob("*")],
-                key=lambda x: x[1],
-            )
-            if len(remaining_files) > max_files:
-                files_to_delete = remaining_files[: (len(remaining_files) - max_files)]
+            if len(files) > max_files:
+                files.sort(key=lambda x: x[1])
+                files_to_delete = files[: (len(files) - max_files)]
                 for file_path, _ in files_to_delete:
                     if verbose:
                         print(f"Deleting (count): {file_path}")
                     file_path.unlink(missing_ok=True)
 
+        # Remove aliases left pointing at deleted files
+        for alias in aliases:
+            if not alias.exists():
+                if verbose:
+                    print(f"Deleting (alias): {alias}")
+                alias.unlink(missing_ok=True)
+
     except Exception as e:
         if verbose:
             print(f"Warning: Cache cleanup error: {e}", file=sys.stderr)
@@ -0,0 +1,28 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from asl_tts_lib.audio import concat_audio
+
+class ConcatAudioTests(unittest.TestCase):
+    def test_ulaw_concat_is_byte_append(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            a = Path(tmp) / "a.ul"
+            b = Path(tmp) / "b.ulaw"
+            a.write_bytes(b"\x01\x02")
+            b.write_bytes(b"\x03")
+            out = Path(tmp) / "out" / "c.ul"
+            concat_audio([str(a), str(b)], str(out))
+            self.assertEqual(out.read_bytes(), b"\x01\x02\x03")
+
+    def test_failure_leaves_no_partial_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            a = Path(tmp) / "a.ul"
+            a.write_bytes(b"\x01\x02")
+            out = Path(tmp) / "c.ul"
+            with self.assertRaises(FileNotFoundError):
+                concat_audio([str(a), str(Path(tmp) / "missing.ul")], str(out))
+            self.assertEqual(sorted(os.listdir(tmp)), ["a.ul"])
+
+if __name__ == "__main__":
+    unittest.main()
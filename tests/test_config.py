@@ -1,3 +1,4 @@
+import tempfile
 import unittest
 import sys
 from types import SimpleNamespace
@@ -12,6 +13,16 @@ class ConfigTests(unittest.TestCase):
         self.assertIsInstance(cfg.sounds_directory, Path)
         self.assertIsInstance(cfg.custom_sounds_directory, Path)
         self.assertIsInstance(cfg.cache_directory, Path)
+    def test_ensure_dirs_creates_directories(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cfg = Config(
+                custom_sounds_directory=Path(tmp) / "custom",
+                cache_directory=Path(tmp) / "cache",
+            )
+            self.assertFalse(cfg.cache_directory.exists())
+            cfg.ensure_dirs()
+            self.assertTrue(cfg.custom_sounds_directory.is_dir())
+            self.assertTrue(cfg.cache_directory.is_dir())
 
 if __name__ == "__main__":
     unittest.main()
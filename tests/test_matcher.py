@@ -0,0 +1,63 @@
+import tempfile
+import unittest
+from pathlib import Path
+from asl_tts_lib.config import Config
+from asl_tts_lib.matcher import build_sound_index, find_sound_matches, get_sound_index
+from asl_tts_lib.sounds import load_sound_files
+
+SOUNDS = {
+    "digits/1": "/s/digits/1.ulaw",
+    "digits/2": "/s/digits/2.ulaw",
+    "letters/a": "/s/letters/a.ulaw",
+    "letters/b": "/s/letters/b.ulaw",
+    "phonetic/a_p": "/s/phonetic/a_p.ulaw",
+    "silence/1": "/s/silence/1.ulaw",
+    "connected to": "/s/rpt/connected-to.ulaw",
+    "node": "/s/node.ulaw",
+}
+
+class FindSoundMatchesTests(unittest.TestCase):
+    def setUp(self):
+        self.config = Config(on_missing="skip")
+
+    def test_longest_phrase_match(self):
+        matches = find_sound_matches(["node", "connected-to"], SOUNDS, self.config)
+        self.assertEqual(matches, ["/s/node.ulaw", "/s/rpt/connected-to.ulaw"])
+        matches = find_sound_matches(["connected", "to", "node"], SOUNDS, self.config)
+        self.assertEqual(matches, ["/s/rpt/connected-to.ulaw", "/s/node.ulaw"])
+
+    def test_prebuilt_sound_index(self):
+        index = build_sound_index(SOUNDS)
+        for tokens in (["connected", "to", "node"], ["AB", "12", ","]):
+            self.assertEqual(
+                find_sound_matches(tokens, SOUNDS, self.config, sound_index=index),
+                find_sound_matches(tokens, SOUNDS, self.config),
+            )
+
+    def test_sound_index_kept_with_loaded_sounds(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp) / "en"
+            (base / "letters").mkdir(parents=True)
+            (base / "letters/a.ulaw").write_bytes(b"")
+            config = Config(sounds_directory=base, custom_sounds_directory=Path(tmp) / "custom")
+            sounds = load_sound_files(config)
+            self.assertIs(get_sound_index(sounds), get_sound_index(sounds))
+        self.assertIsNot(get_sound_index(SOUNDS), get_sound_index(SOUNDS))
+
+    def test_letters_digits_and_pauses(self):
+        matches = find_sound_matches(["AB", "12", ",", "[A1]"], SOUNDS, self.config)
+        self.assertEqual(
+            matches,
+            [
+                "/s/letters/a.ulaw",
+                "/s/letters/b.ulaw",
+                "/s/digits/1.ulaw",
+                "/s/digits/2.ulaw",
+                "/s/silence/1.ulaw",
+                "/s/phonetic/a_p.ulaw",
+                "/s/digits/1.ulaw",
+            ],
+        )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import tempfile
+import unittest
+from pathlib import Path
+from asl_tts_lib.config import Config
+from asl_tts_lib.sounds import load_sound_files, normalize_phrase
+
+class LoadSoundFilesTests(unittest.TestCase):
+    def test_load_and_normalize(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp) / "en"
+            custom = Path(tmp) / "custom"
+            for name in [
+                "digits/1.ulaw",
+                "rpt/connected-to.ulaw",
+                "hello.gsm",
+                "README",
+                "notes.txt",
+                ".hidden.ulaw",
+                "custom:hello.ul",
+            ]:
+                root = custom if name.startswith("custom:") else base
+                path = root / name.split(":")[-1]
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(b"")
+
+            config = Config(sounds_directory=base, custom_sounds_directory=custom)
+            sounds = load_sound_files(config)
+
+            self.assertEqual(
+                sounds,
+                {
+                    "digits/1": str(base / "digits/1.ulaw"),
+                    "connected to": str(base / "rpt/connected-to.ulaw"),
+                    "hello": str(custom / "hello.ul"),
+                },
+            )
+
+            # The mapping is cached and shared between callers
+            with self.assertRaises(TypeError):
+                sounds["hello"] = "other.ul"
+
+    def test_reloads_when_subdirectory_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            base = Path(tmp) / "en"
+            (base / "digits").mkdir(parents=True)
+            (base / "digits/1.ulaw").write_bytes(b"")
+            config = Config(sounds_directory=base, custom_sounds_directory=Path(tmp) / "custom")
+            self.assertIs(load_sound_files(config), load_sound_files(config))
+
+            (base / "digits/2.ulaw").write_bytes(b"")
+            self.assertIn("digits/2", load_sound_files(config))
+
+    def test_normalize_phrase(self):
+        self.assertEqual(normalize_phrase("rpt/Connected_to-node.ulaw"), "connected to node")
+        self.assertEqual(normalize_phrase("digits/1.ulaw"), "digits/1")
+        self.assertEqual(normalize_phrase("silence/1"), "silence/1")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+import unittest
+from asl_tts_lib.tokenizer import tokenize_text
+
+class TokenizeTextTests(unittest.TestCase):
+    def test_words_braces_and_pauses(self):
+        self.assertEqual(
+            tokenize_text("Node 2345 connected-to W1AW,, ( good  morning ) [A B]!"),
+            ["Node", "2345", "connected-to", "W1AW", ",", "(good morning)", "[A B]", "!"],
+        )
+
+    def test_special_characters_and_hyphens(self):
+        self.assertEqual(tokenize_text("-a a- x=1+2 --b!"), ["-a", "a-", "x", "=", "1", "+", "2", "-", "b", "!"])
+
+    def test_unclosed_brace_keeps_rest_of_text(self):
+        self.assertEqual(tokenize_text("hi(there  you"), ["hi", "(there  you"])
+
+if __name__ == "__main__":
+    unittest.main()
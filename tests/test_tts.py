@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from asl_tts_lib.config import Config
+from asl_tts_lib.matcher import find_sound_matches
+from asl_tts_lib.tts import forget_phrase_file, generate_missing_phrase, generate_missing_phrases
+
+# Logs its arguments, then writes <-f path>.ul like asl-tts
+FAKE_ASL_TTS = """#!/bin/sh
+printf '%s\\n' "$*" >> "$(dirname "$0")/calls.log"
+echo "$4" > "$6.ul"
+"""
+
+# Batch mode writes every manifest entry except phrases containing "skip"
+FAKE_ASL_TTS_BATCH = """#!/bin/sh
+printf '%s\\n' "$*" >> "$(dirname "$0")/calls.log"
+if [ "$1" = "--batch" ]; then
+    while IFS="$(printf '\\t')" read -r text path; do
+        case "$text" in *skip*) ;; *) echo "$text" > "$path.ul" ;; esac
+    done < "$2"
+    exit 0
+fi
+echo "$4" > "$6.ul"
+"""
+
+# Records "overlap" if another run is in progress
+FAKE_ASL_TTS_SLOW = """#!/bin/sh
+lock="$(dirname "$0")/running"
+mkdir "$lock" 2>/dev/null || echo overlap >> "$(dirname "$0")/calls.log"
+sleep 0.1
+echo "$4" > "$6.ul"
+printf '%s\\n' "$*" >> "$(dirname "$0")/calls.log"
+rmdir "$lock" 2>/dev/null
+"""
+
+class GenerateMissingPhrasesTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        tts_bin = self.dir / "asl-tts"
+        tts_bin.write_text(FAKE_ASL_TTS)
+        os.chmod(tts_bin, 0o755)
+        self.custom = self.dir / "custom"
+        self.config = Config(custom_sounds_directory=self.custom, asl_tts_bin=str(tts_bin), on_missing="skip")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def calls(self):
+        log = self.dir / "calls.log"
+        return log.read_text().splitlines() if log.exists() else []
+
+    def test_single_phrase(self):
+        path = generate_missing_phrase("hello there", "hello-there", self.config)
+        self.assertEqual(path, str(self.custom / "hello-there.ul"))
+        self.assertEqual(Path(path).read_text(), "hello there\n")
+        # Found again without running asl-tts
+        self.assertEqual(generate_missing_phrase("hello there", "hello-there", self.config), path)
+        self.assertEqual(len(self.calls()), 1)
+
+    def test_forgotten_file_is_generated_again(self):
+        path = generate_missing_phrase("hello", "hello", self.config)
+        os.unlink(path)
+        # Existing files are trusted until the caller finds one missing
+        self.assertEqual(generate_missing_phrase("hello", "hello", self.config), path)
+        self.assertEqual(len(self.calls()), 1)
+        forget_phrase_file(path)
+        self.assertEqual(generate_missing_phrase("hello", "hello", self.config), path)
+        self.assertTrue(Path(path).exists())
+        self.assertEqual(len(self.calls()), 2)
+
+    def test_dedupes_and_generates_in_parallel(self):
+        items = [("good morning", ""), ("(good  morning)", ""), ("good evening", ""), ("good night", "")]
+        paths = generate_missing_phrases(items, self.config, workers=3)
+        self.assertEqual(
+            paths,
+            [str(self.custom / f"{name}.ul") for name in ["good-morning", "good-morning", "good-evening", "good-night"]],
+        )
+        self.assertTrue(all(Path(path).exists() for path in paths))
+        self.assertEqual(len(self.calls()), 3)
+
+    def test_find_sound_matches_generates_together(self):
+        sounds = {"node": "/s/node.ulaw"}
+        matches = find_sound_matches(["hello", "node", "world", "hello"], sounds, self.config)
+        self.assertEqual(
+            matches,
+            [str(self.custom / "hello.ul"), "/s/node.ulaw", str(self.custom / "world.ul"), str(self.custom / "hello.ul")],
+        )
+        self.assertEqual(len(self.calls()), 2)
+
+    def test_batch_mode_with_fallback(self):
+        (self.dir / "asl-tts").write_text(FAKE_ASL_TTS_BATCH)
+        self.config.asl_tts_supports_batch = True
+        paths = generate_missing_phrases([("one", ""), ("two", ""), ("skip me", "")], self.config)
+        self.assertEqual(paths, [str(self.custom / f"{name}.ul") for name in ["one", "two", "skip-me"]])
+        self.assertTrue(all(Path(path).exists() for path in paths))
+        calls = self.calls()
+        self.assertEqual(len(calls), 2)
+        self.assertTrue(calls[0].startswith("--batch "))
+        self.assertEqual(calls[1], f"-n 1 -t skip me -f {self.custom / 'skip-me'}")
+
+    def test_tts_parallel_setting(self):
+        (self.dir / "asl-tts").write_text(FAKE_ASL_TTS_SLOW)
+        items = [("one", ""), ("two", ""), ("three", "")]
+        self.config.tts_parallel = False
+        generate_missing_phrases(items, self.config, workers=3)
+        self.assertNotIn("overlap", self.calls())
+        self.assertEqual(len(self.calls()), 3)
+
+        self.config.tts_parallel = True
+        generate_missing_phrases([("four", ""), ("five", ""), ("six", "")], self.config, workers=3)
+        self.assertIn("overlap", self.calls())
+
+if __name__ == "__main__":
+    unittest.main()
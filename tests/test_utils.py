@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from asl_tts_lib.utils import (
+    cache_cleanup,
+    fast_materialize,
+    sanitize_filename_with_hash,
+    touch_cache_file,
+)
+
+class CacheCleanupTests(unittest.TestCase):
+    def test_keeps_newest_ul_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for age, name in enumerate(["new.ul", "mid.ul", "old.ul", "notes.txt"]):
+                path = Path(tmp) / name
+                path.write_bytes(b"")
+                os.utime(path, (1000 - age, 1000 - age))
+            cache_cleanup(tmp, -1, 2)
+            self.assertEqual(sorted(os.listdir(tmp)), ["mid.ul", "new.ul", "notes.txt"])
+
+    def test_aliases_not_counted_and_removed_with_target(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for age, name in enumerate(["new.ul", "old.ul"]):
+                path = Path(tmp) / name
+                path.write_bytes(b"")
+                os.utime(path, (1000 - age, 1000 - age))
+                (Path(tmp) / f"alias-{name}").symlink_to(name)
+            cache_cleanup(tmp, -1, 1)
+            self.assertEqual(sorted(os.listdir(tmp)), ["alias-new.ul", "new.ul"])
+
+    def test_touched_file_kept_as_recently_used(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for age, name in enumerate(["new.ul", "old.ul"]):
+                path = Path(tmp) / name
+                path.write_bytes(b"")
+                os.utime(path, (1000 - age, 1000 - age))
+            self.assertTrue(touch_cache_file(Path(tmp) / "old.ul"))
+            self.assertFalse(touch_cache_file(Path(tmp) / "missing.ul"))
+            cache_cleanup(tmp, -1, 1)
+            self.assertEqual(os.listdir(tmp), ["old.ul"])
+
+
+class FastMaterializeTests(unittest.TestCase):
+    def test_replaces_existing_destination(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src.ul"
+            dst = Path(tmp) / "dst.ul"
+            src.write_bytes(b"new")
+            dst.write_bytes(b"old")
+            fast_materialize(src, dst)
+            self.assertEqual(dst.read_bytes(), b"new")
+
+    def test_destination_has_own_inode(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src.ul"
+            dst = Path(tmp) / "dst.ul"
+            src.write_bytes(b"audio")
+            fast_materialize(src, dst)
+            self.assertFalse(os.path.samefile(src, dst))
+            dst.write_bytes(b"junk")
+            self.assertEqual(src.read_bytes(), b"audio")
+
+    def test_hard_link_destination_replaced(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src.ul"
+            dst = Path(tmp) / "dst.ul"
+            src.write_bytes(b"audio")
+            os.link(src, dst)
+            fast_materialize(src, dst)
+            fast_materialize(src, src)
+            self.assertFalse(os.path.samefile(src, dst))
+            self.assertEqual(dst.read_bytes(), b"audio")
+            self.assertEqual(src.read_bytes(), b"audio")
+
+    def test_directory_destination(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            src = Path(tmp) / "src.ul"
+            out = Path(tmp) / "out"
+            src.write_bytes(b"audio")
+            out.mkdir()
+            fast_materialize(src, out)
+            self.assertEqual((out / "src.ul").read_bytes(), b"audio")
+
+
+class SanitizeFilenameTests(unittest.TestCase):
+    def test_sanitize(self):
+        self.assertEqual(sanitize_filename_with_hash("connected-to", 5), "connected-to")
+        self.assertEqual(sanitize_filename_with_hash("a-", 5), "a")
+        self.assertEqual(sanitize_filename_with_hash("Hello  World!", 5), "hello-world")
+        self.assertEqual(sanitize_filename_with_hash("-", 5), "text")
+        self.assertEqual(
+            sanitize_filename_with_hash("a b c d e f g", 5), "a-b-c-d-e-bc9c5b4c"
+        )
+
+if __name__ == "__main__":
+    unittest.main()